@@ -13,6 +13,7 @@ import logging
 import tldextract
 
 from app.database import get_db
+from app.cache import invalidate_stats_cache
 from app.models.database_models import Website, ExtractedContent, CrawlStatus
 from app.crawler.html_crawler import GobBoCrawler
 
@@ -167,8 +168,8 @@ def crawl_website(
             db.flush()  # Para obtener el ID
 
         # Ejecutar crawler
-        crawler = GobBoCrawler(timeout=30)
-        extracted_data = crawler.crawl(url)
+        with GobBoCrawler(timeout=30) as crawler:
+            extracted_data = crawler.crawl(url)
 
         logger.info(f"Crawling completado para {url}, guardando contenido...")
 
@@ -222,6 +223,7 @@ def crawl_website(
 
         db.commit()
         db.refresh(website)
+        invalidate_stats_cache()
 
         logger.info(f"Contenido guardado exitosamente para Website ID: {website.id}")
 
@@ -244,6 +246,7 @@ def crawl_website(
         if website:
             website.crawl_status = CrawlStatus.FAILED
             db.commit()
+            invalidate_stats_cache()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -255,6 +258,7 @@ def crawl_website(
         if website:
             website.crawl_status = CrawlStatus.FAILED
             db.commit()
+            invalidate_stats_cache()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error durante el crawling: {str(e)}"
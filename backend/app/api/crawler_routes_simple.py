@@ -84,8 +84,8 @@ def crawl_website(request: CrawlRequest) -> CrawlResponse:
 
     try:
         # Ejecutar crawler
-        crawler = GobBoCrawler(timeout=30)
-        extracted_data = crawler.crawl(url)
+        with GobBoCrawler(timeout=30) as crawler:
+            extracted_data = crawler.crawl(url)
 
         logger.info(f"Crawling completado para {url}")
 
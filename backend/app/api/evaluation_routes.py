@@ -43,6 +43,7 @@ from app.schemas.evaluation_schemas import (
 )
 import logging
 from app.services.report_generator import generate_evaluation_report, get_report_filename
+from app.cache import invalidate_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -437,21 +438,23 @@ async def save_evaluation(
     - **institution_id**: ID de la institución evaluada
     - **criteria_results**: Array de {criterion_id, status, observations}
     """
-    # ── DEBUG ────────────────────────────────────────────────────────────────
-    logger.info("=" * 60)
-    logger.info("DEBUG save_evaluation: datos recibidos del frontend")
-    logger.info(f"  institution_id : {request.institution_id}")
-    logger.info(f"  criteria_results count: {len(request.criteria_results)}")
-    logger.info(f"  scores_override recibido: {request.scores_override}")
-    for item in request.criteria_results:
-        meta = _CRITERIA_META.get(item.criterion_id, {})
-        logger.info(
-            f"  criterio: id={item.criterion_id!r:20s}  "
-            f"status={item.status!r:10s}  "
-            f"score={item.score}  max_score={item.max_score}  "
-            f"meta_dimension={meta.get('dimension', 'NO_EN_META')!r}"
-        )
-    logger.info("=" * 60)
+    # ── DEBUG (solo se formatea si el nivel DEBUG está activo) ───────────────
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("=" * 60)
+        logger.debug("DEBUG save_evaluation: datos recibidos del frontend")
+        logger.debug("  institution_id : %s", request.institution_id)
+        logger.debug("  criteria_results count: %d", len(request.criteria_results))
+        logger.debug("  scores_override recibido: %s", request.scores_override)
+        for item in request.criteria_results:
+            meta = _CRITERIA_META.get(item.criterion_id, {})
+            logger.debug(
+                f"  criterio: id={item.criterion_id!r:20s}  "
+                f"status={item.status!r:10s}  "
+                f"score={item.score}  max_score={item.max_score}  "
+                f"meta_dimension={meta.get('dimension', 'NO_EN_META')!r}"
+            )
+        logger.debug("=" * 60)
     # ── FIN DEBUG ────────────────────────────────────────────────────────────
 
     # 1. Buscar institución
@@ -527,13 +530,14 @@ async def save_evaluation(
         criteria_records.append(cr)
 
     # ── DEBUG: dimensiones asignadas a cada criterio guardado ────────────────
-    logger.info("DEBUG save_evaluation: criteria_records a guardar en BD")
-    from collections import defaultdict
-    dim_summary: dict = defaultdict(list)
-    for cr in criteria_records:
-        dim_summary[cr.dimension].append(f"{cr.criteria_id}(score={cr.score}/{cr.max_score})")
-    for dim, items in sorted(dim_summary.items()):
-        logger.info(f"  dimension={dim!r}: {items}")
+    if debug_enabled:
+        logger.debug("DEBUG save_evaluation: criteria_records a guardar en BD")
+        from collections import defaultdict
+        dim_summary: dict = defaultdict(list)
+        for cr in criteria_records:
+            dim_summary[cr.dimension].append(f"{cr.criteria_id}(score={cr.score}/{cr.max_score})")
+        for dim, items in sorted(dim_summary.items()):
+            logger.debug("  dimension=%r: %s", dim, items)
     # ── FIN DEBUG ────────────────────────────────────────────────────────────
 
     # 5. Calcular puntajes
@@ -558,13 +562,17 @@ async def save_evaluation(
         scores = _calculate_scores(criteria_records)
 
     # ── DEBUG: scores finales usados para guardar ────────────────────────────
-    logger.info("DEBUG save_evaluation: scores finales a persistir")
-    logger.info(f"  fuente: {'scores_override' if request.scores_override else '_calculate_scores'}")
-    for key, val in scores.items():
-        if isinstance(val, dict):
-            logger.info(f"  {key}: percentage={val.get('percentage')}  (dict completo: {val})")
-        else:
-            logger.info(f"  {key}: {val}")
+    if debug_enabled:
+        logger.debug("DEBUG save_evaluation: scores finales a persistir")
+        logger.debug(
+            "  fuente: %s",
+            'scores_override' if request.scores_override else '_calculate_scores'
+        )
+        for key, val in scores.items():
+            if isinstance(val, dict):
+                logger.debug("  %s: percentage=%s  (dict completo: %s)", key, val.get('percentage'), val)
+            else:
+                logger.debug("  %s: %s", key, val)
     # ── FIN DEBUG ────────────────────────────────────────────────────────────
 
     # Helper: extrae 'percentage' de un valor que puede ser dict, número o None
@@ -591,13 +599,14 @@ async def save_evaluation(
     evaluation.completed_at = datetime.now(_TZ_BOT).replace(tzinfo=None)
 
     # ── DEBUG: valores finales en el objeto Evaluation antes del commit ───────
-    logger.info("DEBUG save_evaluation: campos evaluation antes de commit")
-    logger.info(f"  score_accessibility       = {evaluation.score_accessibility}")
-    logger.info(f"  score_usability           = {evaluation.score_usability}")
-    logger.info(f"  score_semantic_web        = {evaluation.score_semantic_web}  "
-                f"(sem_tecnica={sem_tecnica}, sem_nlp={sem_nlp})")
-    logger.info(f"  score_digital_sovereignty = {evaluation.score_digital_sovereignty}")
-    logger.info(f"  score_total               = {evaluation.score_total}")
+    if debug_enabled:
+        logger.debug("DEBUG save_evaluation: campos evaluation antes de commit")
+        logger.debug("  score_accessibility       = %s", evaluation.score_accessibility)
+        logger.debug("  score_usability           = %s", evaluation.score_usability)
+        logger.debug("  score_semantic_web        = %s  (sem_tecnica=%s, sem_nlp=%s)",
+                     evaluation.score_semantic_web, sem_tecnica, sem_nlp)
+        logger.debug("  score_digital_sovereignty = %s", evaluation.score_digital_sovereignty)
+        logger.debug("  score_total               = %s", evaluation.score_total)
     # ── FIN DEBUG ────────────────────────────────────────────────────────────
 
     # 7. Guardar NLPAnalysis
@@ -658,6 +667,7 @@ async def save_evaluation(
     try:
         db.commit()
         db.refresh(evaluation)
+        invalidate_stats_cache()
         logger.info(
             f"Evaluación manual guardada: id={evaluation.id}, "
             f"institution={institution.name}, total={evaluation.score_total:.1f}%"
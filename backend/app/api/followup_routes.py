@@ -21,6 +21,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
+from app.cache import invalidate_stats_cache
 from app.models.database_models import CriteriaResult, Evaluation, Followup, Institution, User, Website
 from app.auth.dependencies import (
     get_current_active_user,
@@ -156,6 +157,7 @@ async def create_followup(
     )
     db.add(followup)
     db.commit()
+    invalidate_stats_cache()
     db.refresh(followup)
 
     # Recargar con relación para devolver datos completos
@@ -241,6 +243,7 @@ async def create_followup_bulk(
         created_followups.append(followup)
 
     db.commit()
+    invalidate_stats_cache()
     for f in created_followups:
         db.refresh(f)
 
@@ -359,6 +362,7 @@ async def mark_corrected(
         followup.notes = data.notes
 
     db.commit()
+    invalidate_stats_cache()
     db.refresh(followup)
 
     # Notificar al evaluador que realizó la evaluación (no bloqueante)
@@ -448,6 +452,7 @@ async def validate_correction(
     followup.validation_notes = data.notes or None
 
     db.commit()
+    invalidate_stats_cache()
     db.refresh(followup)
 
     # Notificación por email (no bloqueante)
@@ -497,6 +502,7 @@ async def cancel_followup(
 
     followup.status = "cancelled"
     db.commit()
+    invalidate_stats_cache()
     db.refresh(followup)
     return _followup_to_dict(_load_followup(followup_id, db))
 
@@ -527,5 +533,6 @@ async def update_followup(
         followup.notes = data.notes
 
     db.commit()
+    invalidate_stats_cache()
     db.refresh(followup)
     return _followup_to_dict(_load_followup(followup_id, db))
@@ -12,6 +12,7 @@ import tldextract
 import logging
 
 from app.database import get_db
+from app.cache import invalidate_stats_cache
 from app.models.database_models import Website, Evaluation, CrawlStatus, EvaluationStatus
 from app.schemas.pydantic_schemas import (
     WebsiteCreate,
@@ -79,6 +80,7 @@ def create_website(
     db.add(db_website)
     db.commit()
     db.refresh(db_website)
+    invalidate_stats_cache()
 
     logger.info(f"Sitio web creado: {db_website.id} - {db_website.url}")
     return db_website
@@ -290,6 +292,7 @@ def create_evaluation(
     db.add(db_evaluation)
     db.commit()
     db.refresh(db_evaluation)
+    invalidate_stats_cache()
 
     logger.info(f"Evaluación creada: {db_evaluation.id} para sitio {website.url}")
 
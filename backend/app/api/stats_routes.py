@@ -8,19 +8,36 @@ Provee endpoints para:
 - Métricas generales del sistema
 """
 
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from collections import Counter
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session, load_only, selectinload
 from sqlalchemy import func
-from datetime import datetime, date, timedelta
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, date, time, timedelta
 from app.database import get_db
 from app.models.database_models import Evaluation, User, Website, Institution, Followup
 from app.auth.dependencies import allow_admin_secretary
+from app.cache import cache_manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
+# TTL (segundos) de las metricas cacheadas en Redis. No dependen del usuario,
+# por lo que la clave nunca incluye current_user.
+OVERVIEW_CACHE_TTL = 300
+CALENDAR_CACHE_TTL = 600
+# Tiempo que se conserva la última respuesta válida para servirla si la BD falla
+STALE_CACHE_TTL = 86400
+STALE_WARNING = '110 - "Response is Stale"'
+# Cache del navegador para las métricas que el dashboard consulta periódicamente
+BROWSER_CACHE_CONTROL = "private, max-age=60"
+
+_ONE_DAY = timedelta(days=1)
+
 def bolivia_day_range(date_str: str):
     """
     Retorna el rango [inicio, fin) de un día en hora Bolivia.
@@ -30,12 +47,30 @@ def bolivia_day_range(date_str: str):
 
     Ejemplo: '2026-02-13' → [2026-02-13T00:00, 2026-02-14T00:00)
     """
-    target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-    start = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0)
-    end = start + timedelta(days=1)
+    start = datetime.combine(date.fromisoformat(date_str), time.min)
+    end = start + _ONE_DAY
     return start, end
 
 
+def conditional_response(request: Request, response: Response, body: dict):
+    """
+    Agrega ETag y Cache-Control a la respuesta.
+
+    Si el cliente envía If-None-Match con el mismo ETag, retorna
+    304 Not Modified sin cuerpo. El header Warning de una respuesta
+    obsoleta se conserva también en el 304.
+    """
+    etag = f'"{hashlib.md5(orjson.dumps(body, option=orjson.OPT_SORT_KEYS)).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": BROWSER_CACHE_CONTROL}
+    warning = response.headers.get("Warning")
+    if warning is not None:
+        headers["Warning"] = warning
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return body
+
+
 @router.get("/daily-evaluations")
 async def get_daily_evaluations(
     date: str = Query(..., description="Fecha en formato YYYY-MM-DD"),
@@ -45,14 +80,36 @@ async def get_daily_evaluations(
     """Obtener evaluaciones realizadas en un día específico, agrupadas por evaluador."""
     # Los timestamps en BD ya están en hora Bolivia (naive), filtrar directamente
     start, end = bolivia_day_range(date)
-    logger.info(f"daily-evaluations: fecha={date}, rango Bolivia=[{start}, {end})")
-
-    evaluations = db.query(Evaluation).filter(
+    logger.info("daily-evaluations: fecha=%s, rango Bolivia=[%s, %s)", date, start, end)
+
+    # Solo se cargan las columnas usadas en la respuesta; website y evaluador
+    # se traen en bloque con selectinload en lugar de una consulta por fila
+    evaluations = db.query(Evaluation).options(
+        load_only(
+            Evaluation.id, Evaluation.evaluator_id, Evaluation.website_id,
+            Evaluation.score_total, Evaluation.status,
+            Evaluation.started_at, Evaluation.completed_at,
+        ),
+        selectinload(Evaluation.website).load_only(
+            Website.url, Website.domain, Website.institution_name
+        ),
+        selectinload(Evaluation.evaluator).load_only(
+            User.full_name, User.username, User.email
+        ),
+    ).filter(
         Evaluation.started_at >= start,
         Evaluation.started_at < end
     ).all()
 
-    logger.info(f"Encontradas {len(evaluations)} evaluaciones")
+    logger.info("Encontradas %d evaluaciones", len(evaluations))
+
+    # Nombres actuales de las instituciones, en una sola consulta por dominio
+    domains = {ev.website.domain for ev in evaluations if ev.website}
+    institution_names = dict(
+        db.query(Institution.domain, Institution.name)
+        .filter(Institution.domain.in_(domains))
+        .all()
+    ) if domains else {}
 
     evaluations_by_evaluator = {}
     for ev in evaluations:
@@ -68,7 +125,7 @@ async def get_daily_evaluations(
                     "evaluations": []
                 }
             else:
-                evaluator = db.query(User).filter(User.id == evaluator_id).first()
+                evaluator = ev.evaluator
                 if evaluator:
                     evaluations_by_evaluator[evaluator_id] = {
                         "evaluator_name": evaluator.full_name or evaluator.username,
@@ -82,7 +139,7 @@ async def get_daily_evaluations(
                         "evaluations": []
                     }
 
-        website = db.query(Website).filter(Website.id == ev.website_id).first()
+        website = ev.website
         # El timestamp ya está en hora Bolivia, usar la hora directamente
         bolivia_hour = ev.started_at.hour if ev.started_at else 0
 
@@ -90,11 +147,9 @@ async def get_daily_evaluations(
         # usando el dominio del website (evita nombres desactualizados en websites)
         institution_name = "N/A"
         if website:
-            institution = db.query(Institution).filter(Institution.domain == website.domain).first()
-            if institution:
-                institution_name = institution.name
-            else:
-                institution_name = website.institution_name  # fallback
+            institution_name = institution_names.get(
+                website.domain, website.institution_name  # fallback
+            )
 
         evaluations_by_evaluator[evaluator_id]["evaluations"].append({
             "id": ev.id,
@@ -124,35 +179,33 @@ async def get_hourly_activity(
     """Obtener actividad por hora en un día específico (horas en zona horaria Bolivia)."""
     # Los timestamps en BD ya están en hora Bolivia (naive)
     start, end = bolivia_day_range(date)
-    logger.info(f"hourly-activity: fecha={date}, rango Bolivia=[{start}, {end})")
+    logger.info("hourly-activity: fecha=%s, rango Bolivia=[%s, %s)", date, start, end)
 
-    evaluations = db.query(Evaluation).filter(
+    evaluations = db.query(Evaluation).options(
+        load_only(Evaluation.started_at)
+    ).filter(
         Evaluation.started_at >= start,
         Evaluation.started_at < end
     ).all()
 
-    logger.info(f"Encontradas {len(evaluations)} evaluaciones para gráfico")
+    logger.info("Encontradas %d evaluaciones para gráfico", len(evaluations))
 
     # Los timestamps ya están en hora Bolivia, usar la hora directamente
-    hourly_data = {hour: 0 for hour in range(24)}
-
-    for ev in evaluations:
-        if ev.started_at:
-            hour = ev.started_at.hour
-            hourly_data[hour] += 1
-            logger.info(f"Eval {ev.id}: hora Bolivia={hour}h")
+    hourly_counts = Counter(ev.started_at.hour for ev in evaluations if ev.started_at)
 
     return {
         "date": date,
         "hourly_activity": [
-            {"hour": hour, "count": count}
-            for hour, count in sorted(hourly_data.items())
+            {"hour": hour, "count": hourly_counts.get(hour, 0)}
+            for hour in range(24)
         ]
     }
 
 
 @router.get("/monthly-calendar")
 async def get_monthly_calendar(
+    request: Request,
+    response: Response,
     year: int = Query(...),
     month: int = Query(...),
     current_user=Depends(allow_admin_secretary),
@@ -161,6 +214,11 @@ async def get_monthly_calendar(
     """Obtener conteo de evaluaciones por cada día del mes (en zona horaria Bolivia)."""
     import calendar as cal_module
 
+    cache_key = f"stats:calendar:{year}:{month}"
+    cached, is_stale = cache_manager.get_with_stale(cache_key)
+    if cached is not None and not is_stale:
+        return conditional_response(request, response, cached)
+
     # Los timestamps en BD ya están en hora Bolivia (naive)
     first_day_str = f"{year}-{month:02d}-01"
     days_in_month = cal_module.monthrange(year, month)[1]
@@ -169,50 +227,76 @@ async def get_monthly_calendar(
     start, _ = bolivia_day_range(first_day_str)
     _, end = bolivia_day_range(last_day_str)
 
-    evaluations = db.query(Evaluation).filter(
-        Evaluation.started_at >= start,
-        Evaluation.started_at < end
-    ).all()
-
-    # Los timestamps ya están en hora Bolivia, agrupar directamente por fecha
-    calendar_data = {}
-    for ev in evaluations:
-        if ev.started_at:
-            day_str = ev.started_at.date().isoformat()
-            calendar_data[day_str] = calendar_data.get(day_str, 0) + 1
-
-    return {
+    # Los timestamps ya están en hora Bolivia, agrupar por fecha en la BD
+    day = func.date(Evaluation.started_at).label("day")
+    try:
+        rows = db.query(day, func.count(Evaluation.id)).filter(
+            Evaluation.started_at >= start,
+            Evaluation.started_at < end
+        ).group_by(day).all()
+    except SQLAlchemyError as e:
+        if cached is None:
+            raise
+        logger.warning("monthly-calendar: BD no disponible, sirviendo cache obsoleto (%s)", e)
+        response.headers["Warning"] = STALE_WARNING
+        return conditional_response(request, response, cached)
+
+    calendar_data = {str(day_value): count for day_value, count in rows}
+
+    result = {
         "year": year,
         "month": month,
         "days": calendar_data
     }
+    cache_manager.set_with_stale(
+        cache_key, result, fresh_ttl=CALENDAR_CACHE_TTL, stale_ttl=STALE_CACHE_TTL
+    )
+    return conditional_response(request, response, result)
 
 
 @router.get("/overview")
 async def get_overview(
+    request: Request,
+    response: Response,
     current_user=Depends(allow_admin_secretary),
     db: Session = Depends(get_db)
 ):
     """Métricas generales del sistema."""
-    total_websites = db.query(Website).count()
-    total_evaluations = db.query(Evaluation).count()
-
-    now = datetime.now()
-    month_start = date(now.year, now.month, 1)
-    evaluations_this_month = db.query(Evaluation).filter(
-        Evaluation.started_at >= month_start
-    ).count()
-
-    avg_score = db.query(func.avg(Evaluation.score_total)).scalar() or 0
-
-    pending_followups = db.query(Followup).filter(
-        Followup.status == "pending"
-    ).count()
-
-    return {
+    cache_key = "stats:overview"
+    cached, is_stale = cache_manager.get_with_stale(cache_key)
+    if cached is not None and not is_stale:
+        return conditional_response(request, response, cached)
+
+    try:
+        total_websites = db.query(Website).count()
+        total_evaluations = db.query(Evaluation).count()
+
+        now = datetime.now()
+        month_start = date(now.year, now.month, 1)
+        evaluations_this_month = db.query(Evaluation).filter(
+            Evaluation.started_at >= month_start
+        ).count()
+
+        avg_score = db.query(func.avg(Evaluation.score_total)).scalar() or 0
+
+        pending_followups = db.query(Followup).filter(
+            Followup.status == "pending"
+        ).count()
+    except SQLAlchemyError as e:
+        if cached is None:
+            raise
+        logger.warning("overview: BD no disponible, sirviendo cache obsoleto (%s)", e)
+        response.headers["Warning"] = STALE_WARNING
+        return conditional_response(request, response, cached)
+
+    result = {
         "total_websites": total_websites,
         "total_evaluations": total_evaluations,
         "evaluations_this_month": evaluations_this_month,
         "average_score": round(float(avg_score), 2),
         "pending_followups": pending_followups
     }
+    cache_manager.set_with_stale(
+        cache_key, result, fresh_ttl=OVERVIEW_CACHE_TTL, stale_ttl=STALE_CACHE_TTL
+    )
+    return conditional_response(request, response, result)
@@ -8,6 +8,10 @@ Provee:
 - Instancias pre-construidas para combinaciones comunes de roles
 """
 
+import time
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
@@ -20,6 +24,22 @@ from app.models.database_models import User, Permission
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+@lru_cache(maxsize=2048)
+def _decode_token_claims(token: str) -> tuple[Optional[str], Optional[float]]:
+    """
+    Decodifica el JWT una sola vez por token y retorna (username, exp).
+
+    Los tokens inválidos lanzan JWTError y no se almacenan en el cache;
+    la expiración se vuelve a comprobar en cada uso con el exp cacheado.
+    """
+    payload = jwt.decode(
+        token,
+        settings.secret_key,
+        algorithms=[settings.jwt_algorithm],
+    )
+    return payload.get("sub"), payload.get("exp")
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
@@ -36,16 +56,13 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
+        username, expires_at = _decode_token_claims(token)
     except JWTError:
         raise credentials_exception
+    if username is None:
+        raise credentials_exception
+    if expires_at is not None and expires_at <= time.time():
+        raise credentials_exception
 
     user = (
         db.query(User)
@@ -89,7 +106,8 @@ class RoleChecker:
     """
 
     def __init__(self, allowed_roles: list[str]):
-        self.allowed_roles = allowed_roles
+        # frozenset: verificación O(1) en cada request protegido
+        self.allowed_roles = frozenset(allowed_roles)
 
     def __call__(
         self, current_user: User = Depends(get_current_active_user)
@@ -5,22 +5,30 @@ Utilidades de seguridad: hashing de contraseñas y gestión de tokens JWT.
 from datetime import datetime, timedelta
 from typing import Optional
 
+import bcrypt
 from jose import jwt
-from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Mismo costo que usaba passlib por defecto: los hashes existentes siguen siendo válidos
+BCRYPT_ROUNDS = 12
 
 
 def hash_password(password: str) -> str:
     """Genera un hash bcrypt de la contraseña."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica una contraseña contra su hash bcrypt."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Hash con formato inválido
+        return False
 
 
 def create_access_token(
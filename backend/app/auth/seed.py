@@ -44,33 +44,36 @@ def seed_users(db: Session) -> None:
 
     Todos se crean sin institution_id (personal interno de AGETIC).
     """
-    created = 0
+    # Una sola consulta para todos los usuarios seed existentes
+    seed_usernames = [user_data["username"] for user_data in SEED_USERS]
+    existing = {
+        username
+        for (username,) in db.query(User.username)
+        .filter(User.username.in_(seed_usernames))
+        .all()
+    }
 
+    new_users = []
     for user_data in SEED_USERS:
-        existing = db.query(User).filter(
-            User.username == user_data["username"]
-        ).first()
-
-        if existing:
+        if user_data["username"] in existing:
             logger.debug(f"Seed: usuario '{user_data['username']}' ya existe, omitiendo")
             continue
 
-        user = User(
+        new_users.append(User(
             username=user_data["username"],
             email=user_data["email"],
             hashed_password=hash_password(user_data["password"]),
             full_name=user_data["full_name"],
             role=user_data["role"],
-        )
-        db.add(user)
-        created += 1
+        ))
         logger.info(
             f"  Seed: creado {user_data['username']} "
             f"({user_data['role'].value}) / {user_data['password']}"
         )
 
-    if created > 0:
+    if new_users:
+        db.add_all(new_users)
         db.commit()
-        logger.info(f"[OK] {created} usuario(s) seed creados")
+        logger.info(f"[OK] {len(new_users)} usuario(s) seed creados")
     else:
         logger.info("[OK] Usuarios seed ya existen, sin cambios")
@@ -3,8 +3,9 @@ Modulo de Cache con Redis
 Maneja caching de resultados con fallback graceful si Redis no esta disponible
 """
 import redis
-import json
+import orjson
 import logging
+import time
 from typing import Optional, Any
 from functools import wraps
 import os
@@ -20,9 +21,15 @@ class CacheManager:
     sin cache (degraded mode).
     """
     
+    # Segundos entre re-verificaciones (PING) de la conexion
+    CHECK_INTERVAL = 30
+    # Claves por lote en clear_pattern (SCAN COUNT y tamaño del pipeline)
+    SCAN_BATCH_SIZE = 500
+
     def __init__(self):
         self._client: Optional[redis.Redis] = None
         self._is_available = False
+        self._last_check = 0.0
         self._initialize_redis()
     
     def _initialize_redis(self):
@@ -30,9 +37,9 @@ class CacheManager:
         try:
             redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
             
+            # Sin decode_responses: los valores se guardan como bytes orjson
             self._client = redis.from_url(
                 redis_url,
-                decode_responses=True,
                 socket_connect_timeout=5,
                 socket_timeout=5,
                 retry_on_timeout=True,
@@ -42,6 +49,7 @@ class CacheManager:
             # Verificar conexion
             self._client.ping()
             self._is_available = True
+            self._last_check = time.monotonic()
             logger.info(f"Redis conectado: {redis_url}")
             
         except redis.ConnectionError:
@@ -55,19 +63,35 @@ class CacheManager:
     
     @property
     def is_available(self) -> bool:
-        """Verifica si Redis esta disponible"""
-        if not self._is_available:
+        """
+        Verifica si Redis esta disponible.
+
+        No hace PING en cada llamada: el estado se re-verifica como maximo
+        cada CHECK_INTERVAL segundos. Los errores de conexion en get/set/delete
+        marcan Redis como no disponible inmediatamente.
+        """
+        if self._client is None:
             return False
-        
+
+        now = time.monotonic()
+        if now - self._last_check < self.CHECK_INTERVAL:
+            return self._is_available
+
+        self._last_check = now
         try:
-            if self._client:
-                self._client.ping()
-                return True
-        except:
+            self._client.ping()
+            self._is_available = True
+        except Exception:
             self._is_available = False
-        
-        return False
-    
+
+        return self._is_available
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        """Marca Redis como no disponible hasta la proxima verificacion"""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self._is_available = False
+            self._last_check = time.monotonic()
+
     def get(self, key: str) -> Optional[Any]:
         """
         Obtiene un valor del cache.
@@ -79,9 +103,10 @@ class CacheManager:
         try:
             value = self._client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
+            self._mark_unavailable(e)
             logger.debug(f"Error al leer cache {key}: {str(e)}")
             return None
     
@@ -94,14 +119,38 @@ class CacheManager:
             return False
         
         try:
-            serialized = json.dumps(value, default=str)
+            serialized = orjson.dumps(
+                value, default=str, option=orjson.OPT_NON_STR_KEYS
+            )
             self._client.setex(key, ttl, serialized)
             logger.debug(f"Cache guardado: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
+            self._mark_unavailable(e)
             logger.debug(f"Error al guardar cache {key}: {str(e)}")
             return False
     
+    def set_with_stale(
+        self, key: str, value: Any, fresh_ttl: int, stale_ttl: int = 86400
+    ) -> bool:
+        """
+        Guarda un valor que se considera fresco durante fresh_ttl segundos
+        pero que se conserva hasta stale_ttl para servirlo como respaldo
+        (stale-while-revalidate) si la fuente de datos falla.
+        """
+        entry = {"data": value, "fresh_until": time.time() + fresh_ttl}
+        return self.set(key, entry, ttl=stale_ttl)
+
+    def get_with_stale(self, key: str) -> tuple[Optional[Any], bool]:
+        """
+        Obtiene un valor guardado con set_with_stale.
+        Retorna (valor, is_stale); (None, False) si no existe.
+        """
+        entry = self.get(key)
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None, False
+        return entry["data"], time.time() >= entry.get("fresh_until", 0)
+
     def delete(self, key: str) -> bool:
         """Elimina un valor del cache"""
         if not self.is_available:
@@ -110,7 +159,8 @@ class CacheManager:
         try:
             self._client.delete(key)
             return True
-        except:
+        except Exception as e:
+            self._mark_unavailable(e)
             return False
     
     def clear_pattern(self, pattern: str) -> int:
@@ -122,13 +172,21 @@ class CacheManager:
             return 0
         
         try:
-            keys = self._client.keys(pattern)
-            if keys:
-                deleted = self._client.delete(*keys)
+            # SCAN + UNLINK en pipeline: no bloquea Redis como KEYS y evita
+            # un round-trip por clave
+            pipe = self._client.pipeline(transaction=False)
+            deleted = 0
+            for key in self._client.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+                pipe.unlink(key)
+                deleted += 1
+                if deleted % self.SCAN_BATCH_SIZE == 0:
+                    pipe.execute()
+            pipe.execute()
+            if deleted:
                 logger.info(f"Cache limpiado: {deleted} claves ({pattern})")
-                return deleted
-            return 0
+            return deleted
         except Exception as e:
+            self._mark_unavailable(e)
             logger.warning(f"Error al limpiar cache: {str(e)}")
             return 0
     
@@ -210,3 +268,11 @@ def get_cache() -> CacheManager:
 def is_redis_available() -> bool:
     """Verifica si Redis esta disponible"""
     return cache_manager.is_available
+
+
+def invalidate_stats_cache() -> int:
+    """
+    Invalida las metricas cacheadas del dashboard (/stats/*).
+    Debe llamarse despues de crear, actualizar o eliminar evaluaciones.
+    """
+    return cache_manager.clear_pattern("stats:*")
@@ -5,19 +5,29 @@ Proporciona funcionalidad para crawlear sitios web gubernamentales
 usando diferentes estrategias: Scrapy, Playwright y requests + BeautifulSoup.
 """
 
-# Importación lazy para evitar errores si faltan dependencias opcionales
-__all__ = ["GobBoSpider", "HTMLParser", "GobBoCrawler"]
+import importlib
+
+# Importación lazy (PEP 562) para no cargar Scrapy/Playwright hasta que se usen
+# y evitar errores si faltan dependencias opcionales.
+# Los tipos para analizadores estáticos están en __init__.pyi.
+_LAZY_ATTRS = {
+    "GobBoSpider": "app.crawler.spider",
+    "HTMLParser": "app.crawler.parser",
+    "GobBoCrawler": "app.crawler.html_crawler",
+}
+
+__all__ = list(_LAZY_ATTRS)
 
 
 def __getattr__(name):
     """Lazy import para evitar errores de dependencias."""
-    if name == "GobBoSpider":
-        from app.crawler.spider import GobBoSpider
-        return GobBoSpider
-    elif name == "HTMLParser":
-        from app.crawler.parser import HTMLParser
-        return HTMLParser
-    elif name == "GobBoCrawler":
-        from app.crawler.html_crawler import GobBoCrawler
-        return GobBoCrawler
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Los siguientes accesos no pasan por __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+from app.crawler.html_crawler import GobBoCrawler as GobBoCrawler
+from app.crawler.parser import HTMLParser as HTMLParser
+from app.crawler.spider import GobBoSpider as GobBoSpider
+
+__all__ = ["GobBoSpider", "HTMLParser", "GobBoCrawler"]
@@ -8,13 +8,71 @@ Autor: Sistema GOB.BO Evaluator
 Fecha: 2025-01-25
 """
 
+from __future__ import annotations
+
 import json
 import os
-from typing import Dict, List, Any
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional
+
+# ijson permite leer el ground truth sitio por sitio sin cargar todo el documento
+try:
+    import ijson
+    HAS_IJSON = True
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    HAS_IJSON = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+
+def _parse_ground_truth(path: str) -> Dict[str, Dict]:
+    """Parsea el JSON de ground truth y retorna un dict URL -> sitio"""
+    if HAS_IJSON:
+        # Streaming: solo se materializa un sitio a la vez
+        with open(path, 'rb') as f:
+            return {
+                site['url']: site for site in ijson.items(f, 'sites.item', use_float=True)
+            }
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+        return {site['url']: site for site in data.get('sites', [])}
+
+
+@lru_cache(maxsize=4)
+def _load_ground_truth_cached(path: str, mtime: float) -> Dict[str, Dict]:
+    """
+    Carga el ground truth una sola vez por proceso para cada (ruta, mtime).
+
+    Todas las instancias de CoverageAnalyzer comparten el dict resultante,
+    que se trata como de solo lectura. Si el archivo cambia, su mtime
+    cambia y se vuelve a cargar.
+    """
+    try:
+        return _parse_ground_truth(path)
+    except FileNotFoundError:
+        print(f"[WARN] Archivo ground truth no encontrado: {path}")
+        return {}
+    except _JSON_ERRORS as e:
+        print(f"[ERROR] Error parseando ground truth: {e}")
+        return {}
+
 
-@dataclass
+# Crawls simultaneos por defecto en generate_report
+DEFAULT_MAX_WORKERS = 5
+# Calculos de cobertura memoizados (compartidos por todas las instancias)
+COVERAGE_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class CoverageResult:
     """Resultado de analisis de cobertura para una categoria"""
     expected: int
@@ -36,6 +94,10 @@ class CoverageAnalyzer:
         'buttons': 0.03,
         'labels': 0.02
     }
+    # Vistas congeladas de los pesos para el calculo de cobertura
+    _WEIGHT_ITEMS = tuple(DEFAULT_WEIGHTS.items())
+    _WEIGHT_KEYS = frozenset(DEFAULT_WEIGHTS)
+    _TOTAL_WEIGHT = sum(DEFAULT_WEIGHTS.values())
 
     # Benchmarks de Googlebot (basados en estudios)
     GOOGLEBOT_BENCHMARKS = {
@@ -62,19 +124,21 @@ class CoverageAnalyzer:
         self._load_ground_truth()
 
     def _load_ground_truth(self) -> None:
-        """Carga datos de ground truth desde archivo JSON"""
+        """
+        Carga datos de ground truth desde archivo JSON.
+
+        El JSON se parsea una sola vez por proceso y el resultado se
+        comparte en memoria entre instancias mientras el archivo no cambie.
+        """
+        path = os.path.abspath(self.ground_truth_file)
         try:
-            with open(self.ground_truth_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.ground_truth = {
-                    site['url']: site for site in data.get('sites', [])
-                }
-        except FileNotFoundError:
+            mtime = os.path.getmtime(path)
+        except OSError:
             print(f"[WARN] Archivo ground truth no encontrado: {self.ground_truth_file}")
             self.ground_truth = {}
-        except json.JSONDecodeError as e:
-            print(f"[ERROR] Error parseando ground truth: {e}")
-            self.ground_truth = {}
+            return
+
+        self.ground_truth = _load_ground_truth_cached(path, mtime)
 
     def get_available_sites(self) -> List[str]:
         """Retorna lista de URLs con ground truth disponible"""
@@ -84,6 +148,18 @@ class CoverageAnalyzer:
         """Verifica si hay ground truth para una URL"""
         return url in self.ground_truth
 
+    @staticmethod
+    def _count(data: Any, list_key: str) -> int:
+        """
+        Conteo de una categoria del crawler: total_count si es distinto de
+        cero, si no la longitud de data[list_key]; listas se cuentan directo.
+        """
+        if isinstance(data, dict):
+            return data.get('total_count') or len(data.get(list_key, ()))
+        if isinstance(data, list):
+            return len(data)
+        return 0
+
     def _extract_counts_from_result(self, result: Dict[str, Any]) -> Dict[str, int]:
         """
         Extrae conteos de elementos desde resultado del crawler.
@@ -96,48 +172,16 @@ class CoverageAnalyzer:
         """
         text_corpus = result.get('text_corpus', {})
 
-        # Contar links - usar total_count o contar all_links
-        links_data = result.get('links', {})
-        if isinstance(links_data, dict):
-            links_count = links_data.get('total_count', 0)
-            if links_count == 0:
-                links_count = len(links_data.get('all_links', []))
-        elif isinstance(links_data, list):
-            links_count = len(links_data)
-        else:
-            links_count = 0
-
-        # Contar imagenes - usar total_count o contar images
-        images_data = result.get('images', {})
-        if isinstance(images_data, dict):
-            images_count = images_data.get('total_count', 0)
-            if images_count == 0:
-                images_count = len(images_data.get('images', []))
-        elif isinstance(images_data, list):
-            images_count = len(images_data)
-        else:
-            images_count = 0
-
-        # Contar formularios - usar total_count o contar forms
-        forms_data = result.get('forms', {})
-        if isinstance(forms_data, dict):
-            forms_count = forms_data.get('total_count', 0)
-            if forms_count == 0:
-                forms_count = len(forms_data.get('forms', []))
-        elif isinstance(forms_data, list):
-            forms_count = len(forms_data)
-        else:
-            forms_count = 0
-
-        # Contar secciones (headings con contenido)
-        sections_count = text_corpus.get('total_sections', 0)
-        if sections_count == 0:
-            # Fallback a headings
-            headings_data = result.get('headings', {})
-            if isinstance(headings_data, dict):
-                sections_count = headings_data.get('total_count', 0)
-                if sections_count == 0:
-                    sections_count = len(headings_data.get('headings', []))
+        # Links, imagenes y formularios: usar total_count o contar la lista
+        links_count = self._count(result.get('links', {}), 'all_links')
+        images_count = self._count(result.get('images', {}), 'images')
+        forms_count = self._count(result.get('forms', {}), 'forms')
+
+        # Contar secciones (headings con contenido); fallback a headings
+        sections_count = (
+            text_corpus.get('total_sections', 0)
+            or self._count(result.get('headings', {}), 'headings')
+        )
 
         # Contar botones
         buttons = text_corpus.get('button_texts', [])
@@ -160,13 +204,20 @@ class CoverageAnalyzer:
             'text_words': text_words
         }
 
-    def measure_coverage(self, crawler_result: Dict[str, Any], url: str = None) -> Dict[str, Any]:
+    def measure_coverage(
+        self,
+        crawler_result: Dict[str, Any],
+        url: str = None,
+        detailed: bool = True
+    ) -> Dict[str, Any]:
         """
         Mide cobertura comparando extraccion vs ground truth.
 
         Args:
             crawler_result: Resultado del crawler para la URL
             url: URL analizada (opcional, se extrae del resultado si no se proporciona)
+            detailed: Si es False se omite el dict 'comparison' por categoria
+                      (derivable de coverage_by_category, ground_truth y extracted)
 
         Returns:
             dict: Analisis de cobertura completo
@@ -174,85 +225,135 @@ class CoverageAnalyzer:
         if url is None:
             url = crawler_result.get('url', '')
 
-        if url not in self.ground_truth:
+        gt_site = self.ground_truth.get(url)
+        if gt_site is None:
             return {
                 'error': f'No hay ground truth disponible para {url}',
                 'suggestion': 'Agregar inspeccion manual a ground_truth_sites.json',
                 'available_sites': self.get_available_sites()
             }
 
-        # Ground truth (inspeccion manual)
-        gt_site = self.ground_truth[url]
-        gt = gt_site['manual_inspection']
-        architecture = gt_site.get('architecture', 'MPA')
-
         # Extraccion del crawler
         extracted = self._extract_counts_from_result(crawler_result)
 
+        return self._compute_coverage(gt_site, url, extracted, detailed)
+
+    @staticmethod
+    @lru_cache(maxsize=COVERAGE_CACHE_SIZE)
+    def _coverage_numbers(gt_items: tuple, extracted_items: tuple) -> tuple:
+        """
+        Porcentajes por categoria y cobertura total ponderada (memoizado).
+
+        Solo se cachean tuplas inmutables: cada llamada a measure_coverage
+        arma sus propios dicts, asi que modificar un resultado no altera
+        los siguientes.
+
+        Args:
+            gt_items: Ground truth como tupla de (categoria, valor esperado)
+            extracted_items: Conteos del crawler como tupla de (categoria, valor)
+
+        Returns:
+            tuple: (tupla de (categoria, porcentaje), cobertura total)
+        """
+        extracted = dict(extracted_items)
+        weight_items = CoverageAnalyzer._WEIGHT_ITEMS
+
         # Calcular cobertura por categoria
         coverage = {}
-        comparison = {}
-
-        for key in gt:
-            gt_value = gt[key]
+        for key, gt_value in gt_items:
             extracted_value = extracted.get(key, 0)
 
             if gt_value > 0:
-                cov_percent = round(min(extracted_value / gt_value * 100, 100), 2)
+                coverage[key] = round(min(extracted_value / gt_value * 100, 100), 2)
             else:
-                cov_percent = 100.0 if extracted_value == 0 else 100.0
-
-            coverage[key] = cov_percent
-            comparison[key] = {
-                'expected': gt_value,
-                'extracted': extracted_value,
-                'missing': max(0, gt_value - extracted_value),
-                'coverage_percent': cov_percent
-            }
+                coverage[key] = 100.0
 
-        # Promedio ponderado
-        total_coverage = 0.0
-        total_weight = 0.0
+        # Promedio ponderado (normalizado por los pesos de las categorias presentes)
+        weighted_sum = sum(coverage[key] * weight for key, weight in weight_items if key in coverage)
+        if CoverageAnalyzer._WEIGHT_KEYS.issubset(coverage):
+            total_weight = CoverageAnalyzer._TOTAL_WEIGHT
+        else:
+            total_weight = sum(weight for key, weight in weight_items if key in coverage)
+
+        total_coverage = round(weighted_sum / total_weight, 2) if total_weight > 0 else 0.0
+        return tuple(coverage.items()), total_coverage
+
+    def _compute_coverage(
+        self,
+        gt_site: Dict[str, Any],
+        url: str,
+        extracted: Dict[str, int],
+        detailed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Arma el analisis de cobertura para conteos ya extraidos.
 
-        for key, weight in self.DEFAULT_WEIGHTS.items():
-            if key in coverage:
-                total_coverage += coverage[key] * weight
-                total_weight += weight
+        Args:
+            gt_site: Entrada de ground truth de la URL
+            url: URL analizada
+            extracted: Conteos del crawler por categoria
+            detailed: Si es True incluye el dict 'comparison' por categoria
 
-        if total_weight > 0:
-            total_coverage = total_coverage / total_weight * 100 / 100
+        Returns:
+            dict: Analisis de cobertura completo (objetos nuevos en cada llamada)
+        """
+        # Ground truth (inspeccion manual), desempaquetado una sola vez
+        gt = dict(gt_site['manual_inspection'])
+        architecture = gt_site.get('architecture', 'MPA')
+        inspection_date = gt_site.get('inspection_date', 'unknown')
+        notes = gt_site.get('notes', '')
 
-        total_coverage = round(total_coverage, 2)
+        # Memoizado por (ground truth, conteos): re-medir el mismo contenido es O(1)
+        coverage_items, total_coverage = self._coverage_numbers(
+            tuple(gt.items()), tuple(extracted.items())
+        )
+        coverage = dict(coverage_items)
 
         # Comparacion con Googlebot
         googlebot_benchmark = self.GOOGLEBOT_BENCHMARKS.get(architecture, 95.0)
         diff_vs_googlebot = round(total_coverage - googlebot_benchmark, 2)
 
-        return {
+        result = {
             'url': url,
             'architecture': architecture,
             'total_coverage_percent': total_coverage,
             'coverage_by_category': coverage,
             'ground_truth': gt,
             'extracted': extracted,
-            'comparison': comparison,
             'googlebot_comparison': {
                 'benchmark': googlebot_benchmark,
                 'your_crawler': total_coverage,
                 'difference': diff_vs_googlebot,
                 'better_than_googlebot': diff_vs_googlebot >= 0
             },
-            'inspection_date': gt_site.get('inspection_date', 'unknown'),
-            'notes': gt_site.get('notes', '')
+            'inspection_date': inspection_date,
+            'notes': notes
         }
-
-    def measure_coverage_with_crawl(self, crawler, url: str) -> Dict[str, Any]:
+        if detailed:
+            result['comparison'] = {
+                key: {
+                    'expected': gt[key],
+                    'extracted': extracted.get(key, 0),
+                    'missing': max(0, gt[key] - extracted.get(key, 0)),
+                    'coverage_percent': cov_percent
+                }
+                for key, cov_percent in coverage_items
+            }
+        return result
+
+    def measure_coverage_with_crawl(
+        self,
+        crawler,
+        url: str,
+        detailed: bool = True
+    ) -> Dict[str, Any]:
         """
         Crawlea una URL y mide su cobertura.
 
         Args:
             crawler: Instancia de GobBoCrawler
             url: URL a analizar
+            detailed: Si es False se omite el dict 'comparison' por categoria
 
         Returns:
             dict: Analisis de cobertura completo
@@ -273,15 +374,32 @@ class CoverageAnalyzer:
                 'url': url
             }
 
-        return self.measure_coverage(result, url)
+        return self.measure_coverage(result, url, detailed)
 
-    def generate_report(self, crawler, urls: List[str] = None) -> Dict[str, Any]:
+    def generate_report(
+        self,
+        crawler,
+        urls: List[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        crawler_factory: Optional[Callable[[], Any]] = None,
+        detailed: bool = True
+    ) -> Dict[str, Any]:
         """
         Genera reporte de cobertura para multiples sitios.
 
+        Los crawls son I/O-bound, por lo que se ejecutan en paralelo con un
+        ThreadPoolExecutor.
+
         Args:
-            crawler: Instancia de GobBoCrawler
+            crawler: Instancia de GobBoCrawler (compartida entre hilos)
             urls: Lista de URLs a analizar. Si es None, usa todas las del ground truth
+            max_workers: Numero maximo de crawls simultaneos
+            crawler_factory: Callable opcional que crea un crawler por hilo,
+                             para crawlers que no son thread-safe. Esos
+                             crawlers se cierran al terminar el reporte
+            detailed: Si es True (por defecto) cada resultado incluye el dict
+                      'comparison', que forma parte del JSON de save_report.
+                      Las estadisticas agregadas solo usan los totales
 
         Returns:
             dict: Reporte completo con estadisticas agregadas
@@ -289,24 +407,78 @@ class CoverageAnalyzer:
         if urls is None:
             urls = self.get_available_sites()
 
+        local = threading.local()
+
+        def measure(url: str) -> Dict[str, Any]:
+            if crawler_factory is None:
+                return self.measure_coverage_with_crawl(crawler, url, detailed)
+            if not hasattr(local, 'crawler'):
+                local.crawler = crawler_factory()
+            return self.measure_coverage_with_crawl(local.crawler, url, detailed)
+
+        workers = max(1, max_workers)
+        barrier = threading.Barrier(workers)
+
+        def release_worker() -> None:
+            # La barrera obliga a que cada hilo del pool ejecute exactamente
+            # una de estas tareas: Playwright sync solo se cierra en su hilo
+            barrier.wait()
+            if crawler_factory is None:
+                close_thread_browser = getattr(crawler, 'close_thread_browser', None)
+                if close_thread_browser is not None:
+                    close_thread_browser()
+            elif hasattr(local, 'crawler'):
+                local.crawler.close()
+
+        coverages: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for url in urls:
+                print(f"\n[INFO] Analizando: {url}")
+                futures[executor.submit(measure, url)] = url
+
+            # Los prints se hacen desde el hilo principal a medida que terminan
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    coverage = future.result()
+                except Exception as e:
+                    coverage = {'error': f'Error al crawlear: {e}', 'url': url}
+                coverages[url] = coverage
+
+                print(f"\n[INFO] Completado: {url}")
+                if 'error' in coverage:
+                    print(f"  [ERROR] {coverage['error']}")
+                else:
+                    print(f"  Arquitectura: {coverage['architecture']}")
+                    print(f"  Cobertura Total: {coverage['total_coverage_percent']}%")
+
+            # Liberar los navegadores de cada hilo antes de cerrar el pool
+            for future in [executor.submit(release_worker) for _ in range(workers)]:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[WARN] No se pudo liberar el crawler de un hilo: {e}")
+
+        # Resultados en el mismo orden que las URLs de entrada,
+        # clasificados por arquitectura en la misma pasada
         results = []
         errors = []
-
+        mpas = []
+        spas = []
         for url in urls:
-            print(f"\n[INFO] Analizando: {url}")
-            coverage = self.measure_coverage_with_crawl(crawler, url)
-
+            coverage = coverages[url]
             if 'error' in coverage:
                 errors.append({'url': url, 'error': coverage['error']})
-                print(f"  [ERROR] {coverage['error']}")
-            else:
-                results.append(coverage)
-                print(f"  Arquitectura: {coverage['architecture']}")
-                print(f"  Cobertura Total: {coverage['total_coverage_percent']}%")
+                continue
+            results.append(coverage)
+            architecture = coverage['architecture']
+            if architecture == 'MPA':
+                mpas.append(coverage)
+            elif architecture == 'SPA':
+                spas.append(coverage)
 
         # Estadisticas agregadas
-        mpas = [r for r in results if r['architecture'] == 'MPA']
-        spas = [r for r in results if r['architecture'] == 'SPA']
 
         summary = {
             'total_sites': len(urls),
@@ -355,6 +527,8 @@ class CoverageAnalyzer:
                 'max_coverage': None
             }
 
+        # sum/min/max builtins recorren la lista en C; no hace falta numpy
+        # para unos pocos porcentajes por sitio
         coverages = [r['total_coverage_percent'] for r in results]
 
         return {
@@ -365,68 +539,96 @@ class CoverageAnalyzer:
         }
 
     def print_report(self, report: Dict[str, Any]) -> None:
-        """Imprime reporte formateado en consola"""
-        print("\n" + "=" * 80)
-        print("ANALISIS DE COBERTURA DE EXTRACCION")
-        print("=" * 80)
+        """Imprime reporte formateado en consola (una sola escritura a stdout)"""
+        lines: List[str] = []
+        w = lines.append
 
-        for result in report['results']:
-            print(f"\n[SITIO] {result['url']}")
-            print(f"   Arquitectura: {result['architecture']}")
-            print(f"   Cobertura Total: {result['total_coverage_percent']}%")
-            print(f"\n   Detalles por categoria:")
+        w("\n" + "=" * 80)
+        w("ANALISIS DE COBERTURA DE EXTRACCION")
+        w("=" * 80)
 
-            for cat, data in result['comparison'].items():
-                print(f"   - {cat:12s}: {data['coverage_percent']:5.1f}% ({data['extracted']}/{data['expected']})")
+        for result in report['results']:
+            w(f"\n[SITIO] {result['url']}")
+            w(f"   Arquitectura: {result['architecture']}")
+            w(f"   Cobertura Total: {result['total_coverage_percent']}%")
+            w(f"\n   Detalles por categoria:")
+
+            comparison = result.get('comparison')
+            if comparison is not None:
+                for cat, data in comparison.items():
+                    w(f"   - {cat:12s}: {data['coverage_percent']:5.1f}% ({data['extracted']}/{data['expected']})")
+            else:
+                # Resultado sin detalle: se deriva de los conteos ya presentes
+                extracted = result['extracted']
+                ground_truth = result['ground_truth']
+                for cat, cov_percent in result['coverage_by_category'].items():
+                    w(f"   - {cat:12s}: {cov_percent:5.1f}% ({extracted.get(cat, 0)}/{ground_truth[cat]})")
 
         if report['errors']:
-            print(f"\n[ERRORES] {len(report['errors'])} sitios fallaron:")
+            w(f"\n[ERRORES] {len(report['errors'])} sitios fallaron:")
             for err in report['errors']:
-                print(f"   - {err['url']}: {err['error']}")
+                w(f"   - {err['url']}: {err['error']}")
 
         # Estadisticas agregadas
         summary = report['summary']
-        print("\n" + "=" * 80)
-        print("ESTADISTICAS AGREGADAS")
-        print("=" * 80)
+        w("\n" + "=" * 80)
+        w("ESTADISTICAS AGREGADAS")
+        w("=" * 80)
 
         if summary['mpas']['count'] > 0:
             stats = summary['mpas']
-            print(f"\n[MPA] MPAs ({stats['count']} sitios):")
-            print(f"   Cobertura promedio: {stats['average_coverage']}%")
-            print(f"   Rango: {stats['min_coverage']}% - {stats['max_coverage']}%")
+            w(f"\n[MPA] MPAs ({stats['count']} sitios):")
+            w(f"   Cobertura promedio: {stats['average_coverage']}%")
+            w(f"   Rango: {stats['min_coverage']}% - {stats['max_coverage']}%")
 
         if summary['spas']['count'] > 0:
             stats = summary['spas']
-            print(f"\n[SPA] SPAs ({stats['count']} sitios):")
-            print(f"   Cobertura promedio: {stats['average_coverage']}%")
-            print(f"   Rango: {stats['min_coverage']}% - {stats['max_coverage']}%")
+            w(f"\n[SPA] SPAs ({stats['count']} sitios):")
+            w(f"   Cobertura promedio: {stats['average_coverage']}%")
+            w(f"   Rango: {stats['min_coverage']}% - {stats['max_coverage']}%")
 
         # Comparacion con Googlebot
         gbot = report.get('googlebot_comparison', {})
         if gbot:
-            print("\n" + "=" * 80)
-            print("COMPARACION CON GOOGLEBOT")
-            print("=" * 80)
+            w("\n" + "=" * 80)
+            w("COMPARACION CON GOOGLEBOT")
+            w("=" * 80)
 
             if 'mpas' in gbot:
                 comp = gbot['mpas']
                 status = "[OK]" if comp['better'] else "[!!]"
-                print(f"\nMPAs:")
-                print(f"  Tu crawler:   {comp['your_crawler']}%")
-                print(f"  Googlebot:    {comp['googlebot']}%")
-                print(f"  Diferencia:   {comp['difference']:+.2f}% {status}")
+                w(f"\nMPAs:")
+                w(f"  Tu crawler:   {comp['your_crawler']}%")
+                w(f"  Googlebot:    {comp['googlebot']}%")
+                w(f"  Diferencia:   {comp['difference']:+.2f}% {status}")
 
             if 'spas' in gbot:
                 comp = gbot['spas']
                 status = "[OK]" if comp['better'] else "[!!]"
-                print(f"\nSPAs:")
-                print(f"  Tu crawler:   {comp['your_crawler']}%")
-                print(f"  Googlebot:    {comp['googlebot']}%")
-                print(f"  Diferencia:   {comp['difference']:+.2f}% {status}")
+                w(f"\nSPAs:")
+                w(f"  Tu crawler:   {comp['your_crawler']}%")
+                w(f"  Googlebot:    {comp['googlebot']}%")
+                w(f"  Diferencia:   {comp['difference']:+.2f}% {status}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
+    def save_report(
+        self,
+        report: Dict[str, Any],
+        output_file: str = 'coverage_analysis_results.json',
+        indent: Optional[int] = 2
+    ) -> None:
+        """
+        Guarda reporte en archivo JSON.
 
-    def save_report(self, report: Dict[str, Any], output_file: str = 'coverage_analysis_results.json') -> None:
-        """Guarda reporte en archivo JSON"""
+        Args:
+            report: Reporte generado por generate_report
+            output_file: Ruta del archivo de salida
+            indent: Sangria del JSON. None genera JSON compacto (mas rapido y
+                    pequeño) para reportes que solo se consumen por maquina
+        """
+        separators = (',', ':') if indent is None else None
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+            json.dump(report, f, indent=indent, separators=separators, ensure_ascii=False)
         print(f"\n[OK] Resultados guardados en: {output_file}")
@@ -1,17 +1,221 @@
 import re
 import socket
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import multiprocessing
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup, Doctype
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, SSLError
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
+# Nodos de texto que BeautifulSoup incluye en get_text(): excluye el contenido
+# de script/style/template/rt/rp, que bs4 guarda con tipos de string propios
+_TEXT_NODES_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template'
+    ' or ancestor::rt or ancestor::rp)]'
+)
+_TEXT_STRINGS_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template'
+    ' or ancestor::rt or ancestor::rp)]',
+    smart_strings=False
+)
+
+# Texto visible para el corpus NLP: además de lo que excluye get_text(),
+# descarta el contenido de <noscript>
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::noscript'
+    ' or ancestor::template or ancestor::rt or ancestor::rp)]',
+    smart_strings=False
+)
+
+# bs4 colapsa los textos formados solo por espacios ASCII a '\n' o ' ',
+# salvo dentro de estas etiquetas
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+_PRESERVE_WHITESPACE_TAGS = frozenset({'pre', 'textarea'})
+
+# DOCTYPE declarado al inicio del documento (solo precedido por BOM, espacios,
+# declaración XML o comentarios)
+_DOCTYPE_RE = re.compile(r'\ufeff?\s*(?:<\?.*?>\s*|<!--.*?-->\s*)*<!doctype', re.IGNORECASE | re.DOTALL)
+
+# Charset en <meta http-equiv="Content-Type" content="...; charset=...">
+_CHARSET_RE = re.compile(r'charset=([^;]+)', re.IGNORECASE)
+
+# Elementos con atributos de presentación obsoletos (GobBoCrawler.OBSOLETE_ATTRIBUTES);
+# width/height en <img> son válidos y no se seleccionan
+_OBSOLETE_ATTRIBUTES_XPATH = etree.XPath(
+    '//*[self::table or self::td or self::tr or self::th or self::div or self::p]'
+    '[@align or @bgcolor or @border or @height or @width]'
+    ' | //img[@align or @bgcolor or @border]'
+)
+
+# Host de una URL http(s) absoluta: lo que sigue a '://' hasta '/', '?' o '#'
+_HTTP_HOST_RE = re.compile(r'https?://([^/?#]*)', re.IGNORECASE)
+
+# Atributos de enlace que indican un botón de compartir en RRSS (PART-05)
+_SHARE_RE = re.compile(r'share|compartir')
+
+# Elementos con atributo lang, en orden del documento (ACC-10)
+_LANG_ELEMENTS_XPATH = etree.XPath('//*[@lang]')
+
+# Patrones de migas de pan (aria-label, clase y Schema.org)
+_BREADCRUMB_LABEL_RE = re.compile(r'breadcrumb|migas|ruta', re.I)
+_BREADCRUMB_CLASS_RE = re.compile(r'breadcrumb', re.I)
+_BREADCRUMB_LIST_SCHEMA_RE = re.compile(r'schema\.org/BreadcrumbList', re.I)
+_LIST_ITEM_SCHEMA_RE = re.compile(r'schema\.org/ListItem', re.I)
+
+# Parser lxml para HTML ya codificado (strings con declaración de encoding)
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def _parse_html_tree(html: str) -> lxml_html.HtmlElement:
+    """
+    Parsea el HTML una sola vez con lxml y devuelve el elemento raíz <html>.
+
+    lxml no acepta strings con declaración de encoding (<?xml ... encoding=...?>),
+    en ese caso se parsea el HTML codificado en UTF-8.
+    """
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        return lxml_html.document_fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError:
+        # Documento sin contenido parseable
+        return lxml_html.document_fromstring('<html></html>')
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """
+    urlparse memoizado para la URL crawleada.
+
+    La misma URL se analiza en la validación, el pre-check TCP, robots.txt y
+    los extractores; en crawl_many() además se repiten orígenes entre URLs.
+    """
+    return urlparse(url)
+
+
+def _url_host(url: str) -> str:
+    """
+    netloc en minúsculas de una URL, igual que urlparse(url.lower()).netloc.
+
+    Las URLs http(s) se resuelven con una expresión anclada, sin pasar por
+    urlparse; el resto de esquemas usa urlparse.
+    """
+    match = _HTTP_HOST_RE.match(url)
+    if match:
+        return match.group(1).lower()
+    return urlparse(url.lower()).netloc
+
+
+@lru_cache(maxsize=8192)
+def _resolve_url(base_url: str, url: str) -> Tuple[str, str]:
+    """
+    URL absoluta y dominio (netloc en minúsculas) de un recurso de la página.
+
+    Memoizado: los mismos CDN, fuentes y scripts se repiten dentro de una
+    página y entre páginas del mismo sitio.
+    """
+    absolute_url = urljoin(base_url, url)
+    return absolute_url, _url_host(absolute_url)
+
+
+def _index_elements(tree: lxml_html.HtmlElement) -> Dict[str, List[Any]]:
+    """
+    Recorre el árbol una sola vez y agrupa los elementos por etiqueta.
+
+    Los extractores consultan este índice en lugar de recorrer el DOM
+    completo por cada etiqueta que necesitan. Cada lista conserva el orden
+    del documento.
+    """
+    index = defaultdict(list)
+    for element in tree.iter(etree.Element):
+        index[element.tag].append(element)
+    return index
+
+
+def _index_tags(soup: BeautifulSoup) -> Dict[str, List[Any]]:
+    """
+    Equivalente a _index_elements para el árbol de BeautifulSoup.
+
+    Los extractores que navegan con BeautifulSoup toman de aquí las etiquetas
+    que antes buscaban con find_all sobre todo el documento.
+    """
+    index = defaultdict(list)
+    for tag in soup.find_all(True):
+        index[tag.name].append(tag)
+    return index
+
+
+def _first_tag(tags: Dict[str, List[Any]], name: str):
+    """Primer elemento con esa etiqueta (equivalente a soup.find(name)) o None."""
+    found = tags.get(name)
+    return found[0] if found else None
+
+
+def _element_text(element, strip: bool = False) -> str:
+    """
+    Texto de un elemento lxml, equivalente a Tag.get_text() de BeautifulSoup.
+
+    Args:
+        element: Elemento lxml
+        strip: Igual que get_text(strip=True): recorta cada fragmento y omite los vacíos
+
+    Returns:
+        str: Texto concatenado del elemento
+    """
+    if strip:
+        return ''.join(text.strip() for text in _TEXT_STRINGS_XPATH(element))
+
+    parts = []
+    for text in _TEXT_NODES_XPATH(element):
+        if not text.strip(_ASCII_SPACES):
+            node = text.getparent()
+            if text.is_tail:
+                node = node.getparent()
+            while node is not None and node.tag not in _PRESERVE_WHITESPACE_TAGS:
+                node = node.getparent()
+            if node is None:
+                text = '\n' if '\n' in text else ' '
+        parts.append(text)
+    return ''.join(parts)
+
+
+@dataclass(slots=True)
+class _LinkRecord:
+    """Enlace extraído por _extract_links; pasa a dict solo si entra en el resultado."""
+    href: str
+    text: str
+    title: str
+    absolute_url: str
+    is_empty: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'href': self.href,
+            'text': self.text,
+            'title': self.title,
+            'absolute_url': self.absolute_url,
+            'is_empty': self.is_empty
+        }
+
+
+def _links_to_dicts(links: List[_LinkRecord]) -> List[Dict[str, Any]]:
+    return [link.to_dict() for link in links]
+
 
 class GobBoCrawler:
     """
@@ -43,16 +247,33 @@ class GobBoCrawler:
     # Fuentes externas conocidas
     FONT_DOMAINS = ['fonts.googleapis.com', 'fonts.gstatic.com', 'use.typekit.net', 'cloud.typography.com']
 
+    # Las listas anteriores compiladas en una sola alternancia cada una:
+    # una búsqueda por enlace/script en lugar de un `in` por dominio
+    SOCIAL_RE = re.compile('|'.join(map(re.escape, SOCIAL_DOMAINS)))
+    MESSAGING_RE = re.compile('|'.join(map(re.escape, MESSAGING_DOMAINS)))
+    TRACKER_RE = re.compile('|'.join(map(re.escape, TRACKER_PATTERNS)))
+    FONT_RE = re.compile('|'.join(map(re.escape, FONT_DOMAINS)))
+
     # Elementos HTML obsoletos
     OBSOLETE_ELEMENTS = ['font', 'center', 'marquee', 'blink', 'big', 'strike']
     OBSOLETE_ATTRIBUTES = ['align', 'bgcolor', 'border', 'height', 'width']  # cuando se usan para presentación
 
     # Textos genéricos de enlaces
-    GENERIC_LINK_TEXTS = [
+    GENERIC_LINK_TEXTS = frozenset((
         'clic aquí', 'click aquí', 'haga clic aquí', 'pulse aquí',
         'aquí', 'ver más', 'leer más', 'más', 'más información',
         'más info', 'continuar', 'siguiente', 'anterior'
-    ]
+    ))
+
+    # Frases genéricas contenidas en el texto de un enlace (corpus NLP, claridad),
+    # compiladas en una sola alternancia: una búsqueda por enlace
+    GENERIC_PHRASES = (
+        'clic aquí', 'haz clic', 'click aquí', 'aquí',
+        'ver más', 'leer más', 'más información', 'continuar',
+        'siguiente', 'anterior', 'atrás', 'más', 'click here',
+        'here', 'read more', 'more'
+    )
+    GENERIC_PHRASES_RE = re.compile('|'.join(map(re.escape, GENERIC_PHRASES)))
 
     # User agent de navegador real para evitar bloqueos a nivel TCP/TLS
     BROWSER_UA = (
@@ -61,6 +282,60 @@ class GobBoCrawler:
         'Chrome/124.0.0.0 Safari/537.36'
     )
 
+    # Recursos que no se descargan al renderizar: el extractor solo lee el DOM
+    # (src/href), nunca el contenido de imágenes, fuentes, multimedia ni CSS
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+    # Espera máxima (ms) a que la red quede inactiva tras el scroll de lazy loading
+    SCROLL_IDLE_TIMEOUT_MS = 2000
+
+    # Pool de conexiones HTTP de la sesión requests (robots.txt y fallback):
+    # hosts distintos con conexiones keep-alive y conexiones por host
+    HTTP_POOL_CONNECTIONS = 20
+    HTTP_POOL_MAXSIZE = 10
+
+    # Páginas renderizadas a la vez por crawl_many() (contextos del mismo navegador)
+    RENDER_CONCURRENCY = 4
+
+    # Ocultar propiedades que delatan que es un navegador automatizado
+    STEALTH_INIT_SCRIPT = """
+        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+        Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] });
+        Object.defineProperty(navigator, 'languages', { get: () => ['es-BO', 'es', 'en'] });
+        window.chrome = { runtime: {} };
+    """
+
+    # Scroll para activar lazy loading: toda la secuencia en una sola
+    # llamada al navegador, que resuelve cuando termina el último paso
+    LAZY_SCROLL_SCRIPT = """
+        async () => {
+            const pause = () => new Promise(r => setTimeout(r, 300));
+            window.scrollTo(0, document.body.scrollHeight / 2);
+            await pause();
+            window.scrollTo(0, document.body.scrollHeight);
+            await pause();
+            window.scrollTo(0, 0);
+        }
+    """
+
+    # Argumentos de lanzamiento de Chromium. Además de bloquear las peticiones,
+    # se desactivan la decodificación de imágenes, la GPU y los servicios en
+    # segundo plano para reducir la memoria de cada renderer
+    BROWSER_ARGS = (
+        '--disable-dev-shm-usage',
+        '--no-sandbox',  # Necesario dentro del contenedor Docker
+        '--disable-blink-features=AutomationControlled',
+        '--disable-infobars',
+        '--window-size=1920,1080',
+        '--start-maximized',
+        '--blink-settings=imagesEnabled=false',
+        '--disable-gpu',
+        '--disable-background-networking',
+        '--disable-sync',
+        '--disable-extensions',
+        '--disable-features=Translate,BackForwardCache,MediaRouter',
+    )
+
     def __init__(self, timeout: int = 30, user_agent: Optional[str] = None):
         self.timeout = timeout
         self.user_agent = user_agent or self.BROWSER_UA
@@ -73,10 +348,99 @@ class GobBoCrawler:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # La sesión vive lo mismo que el crawler: las conexiones (y su handshake
+        # TLS) se reutilizan entre crawls del mismo host
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def _make_playwright_context(self, browser):
-        """Crea un contexto Playwright con configuración anti-detección."""
-        context = browser.new_context(
+        # Navegador Playwright persistente, uno por hilo: la API sync de
+        # Playwright no puede usarse desde un hilo distinto al que la inició
+        self._local = threading.local()
+        self._browsers_lock = threading.Lock()
+        self._browsers: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> 'GobBoCrawler':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_browser(self):
+        """
+        Devuelve el navegador Chromium del hilo actual.
+
+        Playwright y el navegador se lanzan solo en la primera llamada del hilo
+        (o si el navegador se desconectó); cada URL solo crea un contexto nuevo.
+        """
+        handle = getattr(self._local, 'handle', None)
+        if handle is not None and handle['browser'].is_connected():
+            return handle['browser']
+
+        if handle is None:
+            handle = {
+                'playwright': sync_playwright().start(),
+                'browser': None,
+                'thread': threading.current_thread(),
+            }
+            self._local.handle = handle
+            with self._browsers_lock:
+                self._browsers.append(handle)
+
+        logger.info("Lanzando navegador Chromium persistente")
+        handle['browser'] = handle['playwright'].chromium.launch(
+            headless=True,
+            args=list(self.BROWSER_ARGS)
+        )
+        return handle['browser']
+
+    def close_thread_browser(self) -> None:
+        """
+        Cierra el navegador Playwright y el driver del hilo actual.
+
+        La API sync de Playwright solo puede cerrarse desde el hilo que la
+        inició, por lo que cada hilo que haya usado el crawler debe llamar a
+        este método antes de terminar.
+        """
+        handle = getattr(self._local, 'handle', None)
+        if handle is None:
+            return
+        self._local.handle = None
+
+        with self._browsers_lock:
+            self._browsers = [h for h in self._browsers if h is not handle]
+
+        try:
+            if handle['browser'] is not None:
+                handle['browser'].close()
+            handle['playwright'].stop()
+        except Exception as e:
+            logger.warning(f"No se pudo cerrar el navegador Playwright: {e}")
+
+    def close(self) -> None:
+        """
+        Cierra las conexiones HTTP y el navegador Playwright del hilo actual.
+
+        Los navegadores de otros hilos no se tocan (Playwright no permite
+        cerrarlos desde aquí): esos hilos deben llamar a close_thread_browser.
+        """
+        self.session.close()
+        self.close_thread_browser()
+
+        with self._browsers_lock:
+            pending = len(self._browsers)
+        if pending:
+            logger.warning(
+                f"{pending} navegador(es) Playwright pertenecen a otros hilos; "
+                "deben cerrarse con close_thread_browser desde esos hilos"
+            )
+
+    def _context_options(self) -> Dict[str, Any]:
+        """Opciones de los contextos Playwright (API sync y async)."""
+        return dict(
             user_agent=self.BROWSER_UA,
             viewport={'width': 1920, 'height': 1080},
             locale='es-BO',
@@ -91,26 +455,42 @@ class GobBoCrawler:
                 'Upgrade-Insecure-Requests': '1',
             }
         )
-        # Ocultar propiedades que delatan que es un navegador automatizado
-        context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3] });
-            Object.defineProperty(navigator, 'languages', { get: () => ['es-BO', 'es', 'en'] });
-            window.chrome = { runtime: {} };
-        """)
+
+    def _make_playwright_context(self, browser):
+        """Crea un contexto Playwright con configuración anti-detección."""
+        context = browser.new_context(**self._context_options())
+        context.add_init_script(self.STEALTH_INIT_SCRIPT)
+        context.route('**/*', self._route_resource)
         return context
 
+    def _route_resource(self, route) -> None:
+        """Aborta las peticiones de recursos pesados que no afectan al HTML extraído."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_resource_async(self, route) -> None:
+        """Versión async de _route_resource para los contextos de crawl_many()."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    def _attempt_urls(url: str) -> List[str]:
+        """URLs a intentar para cargar `url`: la original y, si es HTTPS, su variante HTTP."""
+        urls_to_try = [url]
+        if url.startswith('https://'):
+            urls_to_try.append('http://' + url[8:])
+        return urls_to_try
+
     def _fetch_page_with_playwright(self, url: str) -> Optional[str]:
         """
         Obtiene el HTML de una URL usando Playwright SYNC.
         Intenta HTTPS y, si falla por conexión, reintenta con HTTP.
         """
-        urls_to_try = [url]
-        # Si la URL es HTTPS, agregar HTTP como alternativa
-        if url.startswith('https://'):
-            urls_to_try.append('http://' + url[8:])
-
-        for attempt_url in urls_to_try:
+        for attempt_url in self._attempt_urls(url):
             result = self._playwright_attempt(attempt_url)
             if result:
                 return result
@@ -121,58 +501,45 @@ class GobBoCrawler:
         return self._fetch_page_with_requests(url)
 
     def _playwright_attempt(self, url: str) -> Optional[str]:
-        """Intento único de carga con Playwright."""
+        """Intento único de carga con Playwright (reutiliza el navegador del hilo)."""
+        context = None
         try:
             logger.info(f"Usando Playwright SYNC para cargar {url}")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-infobars',
-                        '--window-size=1920,1080',
-                        '--start-maximized',
-                    ]
-                )
-
-                context = self._make_playwright_context(browser)
-                page = context.new_page()
-                page.set_default_timeout(self.timeout * 1000)
+            browser = self._get_browser()
+            context = self._make_playwright_context(browser)
+            page = context.new_page()
+            page.set_default_timeout(self.timeout * 1000)
 
-                logger.info(f"Navegando a {url}...")
+            logger.info(f"Navegando a {url}...")
+            try:
+                # 'load' es más tolerante que 'networkidle': espera DOMContentLoaded + recursos básicos
+                page.goto(url, wait_until='load', timeout=self.timeout * 1000)
+            except PlaywrightTimeout:
+                # Si 'load' también falla, intentar con 'domcontentloaded' (más permisivo)
+                logger.warning(f"Timeout con wait_until='load' en {url}, reintentando con 'domcontentloaded'...")
                 try:
-                    # 'load' es más tolerante que 'networkidle': espera DOMContentLoaded + recursos básicos
-                    page.goto(url, wait_until='load', timeout=self.timeout * 1000)
+                    page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
                 except PlaywrightTimeout:
-                    # Si 'load' también falla, intentar con 'domcontentloaded' (más permisivo)
-                    logger.warning(f"Timeout con wait_until='load' en {url}, reintentando con 'domcontentloaded'...")
-                    try:
-                        page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
-                    except PlaywrightTimeout:
-                        browser.close()
-                        return None
+                    return None
 
-                # Scroll para activar lazy loading
-                page.evaluate("""
-                    window.scrollTo(0, document.body.scrollHeight / 2);
-                    setTimeout(() => window.scrollTo(0, document.body.scrollHeight), 300);
-                    setTimeout(() => window.scrollTo(0, 0), 600);
-                """)
-                page.wait_for_timeout(1000)
+            # Scroll para activar lazy loading
+            page.evaluate(self.LAZY_SCROLL_SCRIPT)
+            # Esperar solo lo necesario a que carguen los recursos diferidos
+            try:
+                page.wait_for_load_state('networkidle', timeout=self.SCROLL_IDLE_TIMEOUT_MS)
+            except PlaywrightTimeout:
+                pass
 
-                html = page.content()
-                browser.close()
+            html = page.content()
 
-                logger.info(f"HTML obtenido exitosamente ({len(html)} caracteres)")
+            logger.info(f"HTML obtenido exitosamente ({len(html)} caracteres)")
 
-                if len(html) < 500:
-                    logger.warning(f"Playwright obtuvo solo {len(html)} chars para {url}")
-                    return None
+            if len(html) < 500:
+                logger.warning(f"Playwright obtuvo solo {len(html)} chars para {url}")
+                return None
 
-                return html
+            return html
 
         except PlaywrightTimeout as e:
             logger.error(f"Timeout de Playwright al cargar {url}: {e}")
@@ -180,16 +547,93 @@ class GobBoCrawler:
         except Exception as e:
             logger.error(f"Error con Playwright al cargar {url}: {e}")
             return None
+        finally:
+            # Solo se cierra el contexto (y sus páginas); el navegador se reutiliza
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+
+    async def _render_many(self, urls: List[str], concurrency: int) -> Dict[str, Optional[str]]:
+        """
+        Renderiza varias URLs a la vez con la API async de Playwright.
+
+        Un solo navegador para todo el lote; cada URL usa su propio contexto y
+        como máximo `concurrency` páginas se cargan simultáneamente.
+
+        Returns:
+            dict: URL -> HTML renderizado, o None si Playwright no pudo cargarla
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True, args=list(self.BROWSER_ARGS))
+            try:
+                async def render(url: str) -> Optional[str]:
+                    async with semaphore:
+                        for attempt_url in self._attempt_urls(url):
+                            html = await self._playwright_attempt_async(browser, attempt_url)
+                            if html:
+                                return html
+                        return None
+
+                pages = await asyncio.gather(*(render(url) for url in urls))
+            finally:
+                await browser.close()
+
+        return dict(zip(urls, pages))
+
+    async def _playwright_attempt_async(self, browser, url: str) -> Optional[str]:
+        """Intento único de carga en un contexto nuevo de `browser` (equivale a _playwright_attempt)."""
+        context = None
+        try:
+            logger.info(f"Usando Playwright ASYNC para cargar {url}")
+
+            context = await browser.new_context(**self._context_options())
+            await context.add_init_script(self.STEALTH_INIT_SCRIPT)
+            await context.route('**/*', self._route_resource_async)
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout * 1000)
+
+            try:
+                await page.goto(url, wait_until='load', timeout=self.timeout * 1000)
+            except PlaywrightTimeout:
+                logger.warning(f"Timeout con wait_until='load' en {url}, reintentando con 'domcontentloaded'...")
+                try:
+                    await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
+                except PlaywrightTimeout:
+                    return None
+
+            await page.evaluate(self.LAZY_SCROLL_SCRIPT)
+            try:
+                await page.wait_for_load_state('networkidle', timeout=self.SCROLL_IDLE_TIMEOUT_MS)
+            except PlaywrightTimeout:
+                pass
+
+            html = await page.content()
+
+            if len(html) < 500:
+                logger.warning(f"Playwright obtuvo solo {len(html)} chars para {url}")
+                return None
+
+            return html
+
+        except Exception as e:
+            logger.error(f"Error con Playwright al cargar {url}: {e}")
+            return None
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
 
     def _fetch_page_with_requests(self, url: str) -> Optional[str]:
         """
         Fallback: obtiene HTML usando requests. Intenta HTTPS y luego HTTP si falla.
         """
-        urls_to_try = [url]
-        if url.startswith('https://'):
-            urls_to_try.append('http://' + url[8:])
-
-        for attempt_url in urls_to_try:
+        for attempt_url in self._attempt_urls(url):
             try:
                 logger.info(f"Usando requests como fallback para {attempt_url}")
                 response = self.session.get(
@@ -208,7 +652,7 @@ class GobBoCrawler:
 
         return None
 
-    def _validate_content_loaded(self, soup: BeautifulSoup) -> bool:
+    def _validate_content_loaded(self, tree: lxml_html.HtmlElement, elements: Dict[str, List[Any]]) -> bool:
         """
         Valida que el contenido se haya cargado correctamente.
 
@@ -216,25 +660,32 @@ class GobBoCrawler:
         que el JavaScript se ejecutó y cargó contenido.
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tree: Raíz lxml del documento parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             bool: True si el contenido parece cargado correctamente
         """
-        # Verificar que haya al menos algunos elementos básicos
-        has_links = len(soup.find_all('a')) > 0
-        has_images = len(soup.find_all('img')) > 0
-        has_text = len(soup.get_text(strip=True)) > 100
+        # Al menos debe tener algunos elementos básicos o texto; se responde
+        # con la primera señal positiva
+        if elements['a'] or elements['img']:
+            return True
+
+        # Longitud del texto visible (como get_text(strip=True)) sin construirlo entero
+        text_length = 0
+        for text in _TEXT_STRINGS_XPATH(tree):
+            text_length += len(text.strip())
+            if text_length > 100:
+                return True
 
-        # Al menos debe tener texto o algunos elementos
-        return has_text or has_links or has_images
+        return False
 
     def _is_tcp_reachable(self, url: str, tcp_timeout: int = 8) -> bool:
         """
         Verifica conectividad TCP antes de lanzar Playwright o requests.
         Prueba puerto 443 y 80. Si ambos fallan, el sitio es inalcanzable.
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         host = parsed.netloc
         for port in (443, 80):
             try:
@@ -263,6 +714,147 @@ class GobBoCrawler:
             ValueError: Si la URL es invalida o no es un dominio .gob.bo
             RequestException: Si ocurre un error en la peticion HTTP
         """
+        fetched = self._fetch(url)
+        if 'error' in fetched:
+            return fetched
+
+        return self._parse(fetched['url'], fetched['html'], fetched['robots_txt'])
+
+    def crawl_many(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Crawlea varias URLs renderizándolas en paralelo y repartiendo la extracción entre procesos.
+
+        Las páginas se renderizan con la API async de Playwright: un navegador y
+        hasta `concurrency` contextos cargando a la vez. Las que Playwright no
+        pudo cargar pasan al fallback con requests, como en crawl(). Cada HTML
+        obtenido se envía a un ProcessPoolExecutor para la extracción, que es
+        solo CPU y no escala con hilos por el GIL.
+
+        No debe llamarse desde un event loop en ejecución (usa asyncio.run);
+        desde FastAPI, ejecutarlo en un ThreadPoolExecutor igual que crawl().
+
+        Args:
+            urls: URLs a crawlear
+            max_workers: Procesos de extracción (por defecto, núcleos disponibles)
+            concurrency: Páginas renderizadas a la vez (por defecto RENDER_CONCURRENCY)
+
+        Returns:
+            list: Un resultado por URL, en el mismo orden que `urls`. Las URLs
+            que fallan devuelven un dict con 'error', igual que crawl()
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+
+        # Validación y pre-check TCP antes de abrir el navegador
+        prepared = {}
+        for position, url in enumerate(urls):
+            try:
+                clean_url, error = self._prepare_url(url)
+            except ValueError as e:
+                results[position] = self._error_result(url, str(e))
+                continue
+            if error:
+                results[position] = error
+            else:
+                prepared[position] = clean_url
+
+        rendered: Optional[Dict[str, Optional[str]]] = {}
+        if prepared:
+            try:
+                rendered = asyncio.run(self._render_many(
+                    list(dict.fromkeys(prepared.values())),
+                    concurrency or self.RENDER_CONCURRENCY
+                ))
+            except Exception as e:
+                # Sin navegador async: cada URL se carga con el flujo sync de crawl()
+                logger.error(f"No se pudo renderizar el lote con Playwright async: {e}")
+                rendered = None
+
+        try:
+            # 'spawn': los procesos no heredan por fork los hilos del driver de Playwright
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {}
+                for position, url in prepared.items():
+                    try:
+                        if rendered is None:
+                            html = self._fetch_page_with_playwright(url)
+                        else:
+                            html = rendered.get(url)
+                            if not html:
+                                logger.info(f"Playwright falló en todos los intentos para {url}. Probando requests...")
+                                html = self._fetch_page_with_requests(url)
+                        fetched = self._complete_fetch(url, html)
+                    except Exception as e:
+                        results[position] = self._error_result(url, str(e))
+                        continue
+
+                    if 'error' in fetched:
+                        results[position] = fetched
+                        continue
+
+                    future = executor.submit(_parse_fetched_page, self.timeout, self.user_agent, fetched)
+                    futures[future] = position
+
+                for future in as_completed(futures):
+                    position = futures[future]
+                    try:
+                        results[position] = future.result()
+                    except Exception as e:
+                        results[position] = self._error_result(urls[position], str(e))
+        finally:
+            # El fallback sync abre un navegador ligado a este hilo (puede ser
+            # un hilo del executor por defecto): se cierra aquí mismo
+            if rendered is None:
+                self.close_thread_browser()
+
+        return results
+
+    @staticmethod
+    def _error_result(url: str, message: str) -> Dict[str, Any]:
+        """Resultado de crawl() para una URL que no se pudo procesar."""
+        return {
+            'error': message,
+            'url': url,
+            'crawled_at': datetime.utcnow().isoformat()
+        }
+
+    def _fetch(self, url: str) -> Dict[str, Any]:
+        """
+        Etapa de red de crawl(): valida la URL y obtiene el HTML renderizado y robots.txt.
+
+        Args:
+            url: URL del sitio web a crawlear
+
+        Returns:
+            dict: 'url', 'html' y 'robots_txt', o un dict con 'error' si el
+            sitio no se pudo cargar
+
+        Raises:
+            ValueError: Si la URL es invalida o no es un dominio .gob.bo
+            RequestException: Si ocurre un error en la peticion HTTP
+        """
+        url, error = self._prepare_url(url)
+        if error:
+            return error
+
+        # Usar Playwright SYNC para obtener HTML con JavaScript ejecutado
+        return self._complete_fetch(url, self._fetch_page_with_playwright(url))
+
+    def _prepare_url(self, url: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Valida y limpia la URL y comprueba que el servidor acepte conexiones.
+
+        Returns:
+            tuple: (URL limpia, dict de error si el servidor no es accesible o None)
+
+        Raises:
+            ValueError: Si la URL es invalida o no es un dominio .gob.bo
+        """
         # Validar que URL no sea None o vacia
         if not url or not isinstance(url, str):
             raise ValueError("URL debe ser un string no vacio")
@@ -283,47 +875,81 @@ class GobBoCrawler:
         # Pre-check TCP: falla rápido si el servidor no acepta conexiones
         if not self._is_tcp_reachable(url):
             logger.error(f"El servidor de {url} no acepta conexiones TCP (puerto 80/443)")
-            return {
-                'error': (
-                    'El sitio web no es accesible desde el evaluador. '
-                    'El servidor no responde a las conexiones de red. '
-                    'Posibles causas: el sitio está caído, usa HTTP/3 exclusivamente, '
-                    'o tiene restricciones de acceso desde esta red.'
-                ),
-                'url': url,
-                'crawled_at': datetime.utcnow().isoformat()
-            }
+            return url, self._error_result(
+                url,
+                'El sitio web no es accesible desde el evaluador. '
+                'El servidor no responde a las conexiones de red. '
+                'Posibles causas: el sitio está caído, usa HTTP/3 exclusivamente, '
+                'o tiene restricciones de acceso desde esta red.'
+            )
 
-        try:
-            # Usar Playwright SYNC para obtener HTML con JavaScript ejecutado
-            html = self._fetch_page_with_playwright(url)
+        return url, None
+
+    def _complete_fetch(self, url: str, html: Optional[str]) -> Dict[str, Any]:
+        """
+        Cierra la etapa de red con el HTML ya obtenido: consulta robots.txt.
 
+        Returns:
+            dict: 'url', 'html' y 'robots_txt', o un dict con 'error' si no hay HTML
+        """
+        try:
             if not html:
                 logger.error(f"No se pudo obtener el HTML de {url}")
-                return {
-                    'error': 'No se pudo cargar el sitio web',
-                    'url': url,
-                    'crawled_at': datetime.utcnow().isoformat()
-                }
+                return self._error_result(url, 'No se pudo cargar el sitio web')
+
+            # Verificar robots.txt
+            robots_info = self._check_robots_txt(url)
+
+            return {'url': url, 'html': html, 'robots_txt': robots_info}
 
-            # Parsear HTML con lxml (más rápido que html.parser)
+        except Timeout:
+            logger.error(f"Timeout al crawlear {url}")
+            raise
+        except SSLError as e:
+            logger.error(f"Error SSL al crawlear {url}: {e}")
+            raise
+        except RequestException as e:
+            logger.error(f"Error en petición HTTP para {url}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error inesperado al crawlear {url}: {e}")
+            raise
+
+    def _parse(self, url: str, html: str, robots_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Etapa de extracción de crawl(): solo CPU, sin acceso a red.
+
+        Args:
+            url: URL crawleada
+            html: HTML renderizado de la página
+            robots_info: Resultado de _check_robots_txt()
+
+        Returns:
+            dict: Diccionario con toda la informacion extraida
+        """
+        try:
+            # Parsear HTML con lxml (más rápido que html.parser). Los extractores
+            # de atributos y conteos recorren el árbol lxml directamente; BeautifulSoup
+            # se mantiene para los que navegan texto mixto (enlaces, formularios, corpus)
+            tree = _parse_html_tree(html)
+            elements = _index_elements(tree)
             soup = BeautifulSoup(html, 'lxml')
+            tags = _index_tags(soup)
 
             # Validar que el contenido se cargó correctamente
-            if not self._validate_content_loaded(soup):
+            if not self._validate_content_loaded(tree, elements):
                 logger.warning(f"El sitio {url} parece no haber cargado contenido dinámico correctamente")
                 # Continuar de todos modos, puede ser un sitio estático
 
-            # Verificar robots.txt
-            robots_info = self._check_robots_txt(url)
-
             # Extraer toda la información
-            structure_data = self._extract_structure(soup, html)
-            document_hierarchy = self._extract_document_hierarchy(soup)
+            structure_data = self._extract_structure(tree, elements, html)
+            document_hierarchy = self._extract_document_hierarchy(tags)
 
             # Combinar structure data con document_hierarchy
             structure_data['document_hierarchy'] = document_hierarchy
 
+            external_resources, stylesheets, scripts = self._extract_resources(elements, url)
+
             extracted_data = {
                 'url': url,
                 'final_url': url,  # Playwright maneja redirecciones internamente
@@ -332,33 +958,24 @@ class GobBoCrawler:
                 'robots_txt': robots_info,
                 'raw_html': html,  # HTML crudo para SEM-04 (separación contenido-presentación)
                 'structure': structure_data,
-                'metadata': self._extract_metadata(soup),
-                'semantic_elements': self._extract_semantic_elements(soup),
-                'headings': self._extract_headings(soup),
-                'images': self._extract_images(soup, url),
-                'links': self._extract_links(soup, url),
-                'forms': self._extract_forms(soup),
-                'media': self._extract_media(soup),
-                'external_resources': self._extract_external_resources(soup, url),
-                'stylesheets': self._extract_stylesheets(soup, url),
-                'scripts': self._extract_scripts(soup, url),
-                'language_parts': self._extract_language_parts(soup),  # ACC-10
-                'breadcrumbs': self._extract_breadcrumbs(soup),  # NAV-02
-                'text_corpus': self._extract_text_corpus(soup)
+                'metadata': self._extract_metadata(tree, elements),
+                'semantic_elements': self._extract_semantic_elements(elements),
+                'headings': self._extract_headings(elements),
+                'images': self._extract_images(elements, url),
+                'links': self._extract_links(tags, url),
+                'forms': self._extract_forms(tags),
+                'media': self._extract_media(elements),
+                'external_resources': external_resources,
+                'stylesheets': stylesheets,
+                'scripts': scripts,
+                'language_parts': self._extract_language_parts(tree),  # ACC-10
+                'breadcrumbs': self._extract_breadcrumbs(soup, tags),  # NAV-02
+                'text_corpus': self._extract_text_corpus(soup, tags, elements)
             }
 
             logger.info(f"Crawling completado exitosamente para {url}")
             return extracted_data
 
-        except Timeout:
-            logger.error(f"Timeout al crawlear {url}")
-            raise
-        except SSLError as e:
-            logger.error(f"Error SSL al crawlear {url}: {e}")
-            raise
-        except RequestException as e:
-            logger.error(f"Error en petición HTTP para {url}: {e}")
-            raise
         except Exception as e:
             logger.error(f"Error inesperado al crawlear {url}: {e}")
             raise
@@ -374,7 +991,7 @@ class GobBoCrawler:
             bool: True si es dominio .gob.bo, False en caso contrario
         """
         try:
-            parsed = urlparse(url)
+            parsed = _cached_urlparse(url)
             domain = parsed.netloc.lower()
             return domain.endswith('.gob.bo') or domain == 'gob.bo'
         except Exception:
@@ -392,7 +1009,7 @@ class GobBoCrawler:
         Returns:
             dict: Información sobre robots.txt
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         robots_url = urljoin(base_url, '/robots.txt')
 
@@ -422,28 +1039,27 @@ class GobBoCrawler:
                 content = response.text
                 result['content_preview'] = content[:500]  # Primeros 500 caracteres
 
-                # Analizar contenido
-                lines = content.lower().split('\n')
-
-                # Buscar User-agent: * y Disallow:
+                # Analizar contenido línea a línea sin copiar el archivo completo:
+                # solo se pasa a minúsculas el nombre de la directiva
                 current_user_agent = None
                 disallow_all = False
 
-                for line in lines:
+                for line in content.splitlines():
                     line = line.strip()
+                    directive = line[:11].lower()
 
-                    if line.startswith('user-agent:'):
-                        user_agent = line.split(':', 1)[1].strip()
-                        if user_agent == '*' or 'gob.bo-evaluator' in user_agent.lower():
+                    if directive.startswith('user-agent:'):
+                        user_agent = line[11:].strip().lower()
+                        if user_agent == '*' or 'gob.bo-evaluator' in user_agent:
                             current_user_agent = user_agent
 
-                    elif line.startswith('disallow:') and current_user_agent:
-                        disallow_value = line.split(':', 1)[1].strip()
-                        if disallow_value == '/':
-                            disallow_all = True
+                    elif directive.startswith('disallow:'):
+                        if current_user_agent and not disallow_all:
+                            disallow_all = line[9:].strip() == '/'
 
-                    elif line.startswith('sitemap:'):
-                        sitemap_url = line.split(':', 1)[1].strip()
+                    elif directive.startswith('sitemap:'):
+                        # La URL conserva mayúsculas: la ruta distingue entre ellas
+                        sitemap_url = line[8:].strip()
                         result['has_sitemap'] = True
                         result['sitemap_urls'].append(sitemap_url)
 
@@ -465,7 +1081,12 @@ class GobBoCrawler:
 
         return result
 
-    def _extract_structure(self, soup: BeautifulSoup, _raw_html: str) -> Dict[str, Any]:
+    def _extract_structure(
+        self,
+        tree: lxml_html.HtmlElement,
+        elements: Dict[str, List[Any]],
+        raw_html: str
+    ) -> Dict[str, Any]:
         """
         Extrae la estructura del documento HTML.
 
@@ -475,32 +1096,44 @@ class GobBoCrawler:
         - SEM-04: Separación contenido-presentación (ausencia de elementos obsoletos)
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tree: Raíz lxml del documento parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
             raw_html: HTML raw como string
 
         Returns:
             dict: Información sobre la estructura del documento
         """
-        # SEM-01: Verificar DOCTYPE HTML5
+        # SEM-01: Verificar DOCTYPE HTML5. libxml2 agrega un DOCTYPE HTML 4.0
+        # implícito cuando falta, por eso se confirma en el HTML crudo
         has_html5_doctype = False
         doctype_text = ""
-        for item in soup.contents:
-            if isinstance(item, Doctype):
-                doctype_text = str(item).strip().lower()
-                has_html5_doctype = doctype_text == 'html'
-                break
+        docinfo = tree.getroottree().docinfo
+        if docinfo.root_name and _DOCTYPE_RE.match(raw_html):
+            doctype_text = docinfo.root_name
+            if docinfo.public_id is not None:
+                doctype_text += f' PUBLIC "{docinfo.public_id}"'
+                if docinfo.system_url is not None:
+                    doctype_text += f' "{docinfo.system_url}"'
+            elif docinfo.system_url is not None:
+                doctype_text += f' SYSTEM "{docinfo.system_url}"'
+            doctype_text = doctype_text.strip().lower()
+            has_html5_doctype = doctype_text == 'html'
 
         # SEM-02: Verificar charset UTF-8
         charset = None
-        meta_charset = soup.find('meta', charset=True)
-        if meta_charset:
+        metas = elements['meta']
+        meta_charset = next((meta for meta in metas if 'charset' in meta.attrib), None)
+        if meta_charset is not None:
             charset = meta_charset.get('charset', '').lower()
         else:
             # Buscar en meta http-equiv
-            meta_http_equiv = soup.find('meta', {'http-equiv': 'Content-Type'})
-            if meta_http_equiv:
+            meta_http_equiv = next(
+                (meta for meta in metas if meta.get('http-equiv') == 'Content-Type'),
+                None
+            )
+            if meta_http_equiv is not None:
                 content = meta_http_equiv.get('content', '')
-                charset_match = re.search(r'charset=([^;]+)', content, re.IGNORECASE)
+                charset_match = _CHARSET_RE.search(content)
                 if charset_match:
                     charset = charset_match.group(1).strip().lower()
 
@@ -509,31 +1142,42 @@ class GobBoCrawler:
         # SEM-04: Detectar elementos y atributos obsoletos
         obsolete_elements_found = []
         for tag_name in self.OBSOLETE_ELEMENTS:
-            tags = soup.find_all(tag_name)
-            if tags:
+            count = len(elements[tag_name])
+            if count:
                 obsolete_elements_found.extend([{
                     'tag': tag_name,
-                    'count': len(tags)
+                    'count': count
                 }])
 
         # Detectar atributos obsoletos en elementos comunes
+        # Solo se conservan 20 ejemplos: se busca uno más (21) para saber si
+        # quedaron atributos sin listar y ahí se deja de buscar
         obsolete_attributes_found = []
-        for tag in soup.find_all(['table', 'td', 'tr', 'th', 'img', 'div', 'p']):
+        for tag in _OBSOLETE_ATTRIBUTES_XPATH(tree):
+            attrib = tag.attrib
             for attr in self.OBSOLETE_ATTRIBUTES:
-                if tag.has_attr(attr):
+                if attr in attrib:
                     # Excepciones: width/height en img son válidos
-                    if tag.name == 'img' and attr in ['width', 'height']:
+                    if tag.tag == 'img' and attr in ['width', 'height']:
                         continue
                     obsolete_attributes_found.append({
-                        'tag': tag.name,
+                        'tag': tag.tag,
                         'attribute': attr,
-                        'value': tag[attr]
+                        'value': attrib[attr]
                     })
+                    if len(obsolete_attributes_found) > 20:
+                        break
+            if len(obsolete_attributes_found) > 20:
+                break
+        # Se superó el tope: hay atributos obsoletos que no se listan
+        obsolete_attributes_capped = len(obsolete_attributes_found) > 20
+        if obsolete_attributes_capped:
+            del obsolete_attributes_found[20:]
 
         # FMT-02: Verificar elementos básicos de estructura HTML
-        has_html = soup.find('html') is not None
-        has_head = soup.find('head') is not None
-        has_body = soup.find('body') is not None
+        has_html = tree.tag == 'html'
+        has_head = len(elements['head']) > 0
+        has_body = len(elements['body']) > 0
 
         return {
             'has_html5_doctype': has_html5_doctype,
@@ -541,15 +1185,20 @@ class GobBoCrawler:
             'has_utf8_charset': has_utf8,
             'charset_declared': charset,
             'obsolete_elements': obsolete_elements_found,
-            'obsolete_attributes': obsolete_attributes_found[:20],  # Limitar a 20 ejemplos
-            'has_obsolete_code': len(obsolete_elements_found) > 0 or len(obsolete_attributes_found) > 0,
+            'obsolete_attributes': obsolete_attributes_found,  # Limitado a 20 ejemplos
+            'obsolete_attributes_capped': obsolete_attributes_capped,
+            'has_obsolete_code': (
+                len(obsolete_elements_found) > 0
+                or len(obsolete_attributes_found) > 0
+                or obsolete_attributes_capped
+            ),
             # FMT-02: Estructura básica HTML
             'has_html': has_html,
             'has_head': has_head,
             'has_body': has_body
         }
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_metadata(self, tree: lxml_html.HtmlElement, elements: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Extrae metadatos del documento.
 
@@ -562,32 +1211,37 @@ class GobBoCrawler:
         - IDEN-01: Nombre institución en título
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tree: Raíz lxml del documento parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             dict: Metadatos del documento
         """
         # ACC-03 / IDEN-01: Title
-        title_tag = soup.find('title')
-        title = title_tag.get_text().strip() if title_tag else None
+        title_tags = elements['title']
+        title = _element_text(title_tags[0]).strip() if title_tags else None
         title_length = len(title) if title else 0
 
         # ACC-02: Idioma
-        html_tag = soup.find('html')
-        lang = html_tag.get('lang', '').strip() if html_tag else None
+        lang = tree.get('lang', '').strip() if tree.tag == 'html' else None
+
+        # Primer <meta> por cada name
+        meta_by_name = {}
+        for meta in elements['meta']:
+            meta_by_name.setdefault(meta.get('name'), meta)
 
         # SEO-01: Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc.get('content', '').strip() if meta_desc else None
+        meta_desc = meta_by_name.get('description')
+        description = meta_desc.get('content', '').strip() if meta_desc is not None else None
         description_length = len(description) if description else 0
 
         # SEO-02: Meta keywords
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        keywords = meta_keywords.get('content', '').strip() if meta_keywords else None
+        meta_keywords = meta_by_name.get('keywords')
+        keywords = meta_keywords.get('content', '').strip() if meta_keywords is not None else None
 
         # SEO-03: Meta viewport
-        meta_viewport = soup.find('meta', attrs={'name': 'viewport'})
-        viewport = meta_viewport.get('content', '').strip() if meta_viewport else None
+        meta_viewport = meta_by_name.get('viewport')
+        viewport = meta_viewport.get('content', '').strip() if meta_viewport is not None else None
 
         return {
             'title': title,
@@ -604,7 +1258,7 @@ class GobBoCrawler:
             'has_viewport': viewport is not None
         }
 
-    def _extract_semantic_elements(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_semantic_elements(self, elements: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Extrae elementos semánticos HTML5.
 
@@ -613,7 +1267,7 @@ class GobBoCrawler:
         - NAV-01: Menú de navegación
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             dict: Información sobre elementos semánticos
@@ -621,17 +1275,22 @@ class GobBoCrawler:
         semantic_tags = ['header', 'nav', 'main', 'footer', 'article', 'section', 'aside']
 
         result = {}
+        total_elements = 0
+        types_used = 0
         for tag_name in semantic_tags:
-            tags = soup.find_all(tag_name)
+            count = len(elements[tag_name])
             result[tag_name] = {
-                'count': len(tags),
-                'present': len(tags) > 0
+                'count': count,
+                'present': count > 0
             }
+            total_elements += count
+            if count:
+                types_used += 1
 
         # Calcular resumen
         result['summary'] = {
-            'total_semantic_elements': sum(result[tag]['count'] for tag in semantic_tags),
-            'types_used': sum(1 for tag in semantic_tags if result[tag]['present']),
+            'total_semantic_elements': total_elements,
+            'types_used': types_used,
             'has_basic_structure': (
                 result['header']['present'] and
                 result['nav']['present'] and
@@ -642,7 +1301,7 @@ class GobBoCrawler:
 
         return result
 
-    def _extract_headings(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_headings(self, elements: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Extrae información de encabezados (headings).
 
@@ -651,61 +1310,59 @@ class GobBoCrawler:
         - ACC-09: Encabezados descriptivos
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             dict: Información sobre los encabezados
         """
         headings_list = []
+        by_level = {}
+        empty_headings = 0
+
+        # Validar jerarquía (sin saltos de nivel) en la misma pasada
+        hierarchy_errors = []
+        previous_level = 0
 
         for level in range(1, 7):
             tag_name = f'h{level}'
-            for heading in soup.find_all(tag_name):
-                text = heading.get_text().strip()
-                headings_list.append({
-                    'level': level,
-                    'tag': tag_name,
-                    'text': text,
-                    'length': len(text),
-                    'is_empty': len(text) == 0
-                })
+            level_headings = elements[tag_name]
+            by_level[tag_name] = len(level_headings)
 
-        # Validar jerarquía (sin saltos de nivel)
-        hierarchy_valid = True
-        hierarchy_errors = []
+            for heading in level_headings:
+                text = _element_text(heading).strip()
+                is_empty = len(text) == 0
+                empty_headings += is_empty
 
-        if headings_list:
-            levels_used = [h['level'] for h in headings_list]
-            previous_level = 0
-
-            for i, level in enumerate(levels_used):
                 if level > previous_level + 1:
-                    hierarchy_valid = False
                     hierarchy_errors.append({
-                        'position': i,
+                        'position': len(headings_list),
                         'expected_max': previous_level + 1,
                         'found': level
                     })
                 previous_level = max(previous_level, level)
 
-        # Contar h1
-        h1_count = sum(1 for h in headings_list if h['level'] == 1)
+                headings_list.append({
+                    'level': level,
+                    'tag': tag_name,
+                    'text': text,
+                    'length': len(text),
+                    'is_empty': is_empty
+                })
+
+        h1_count = by_level['h1']
 
         return {
             'headings': headings_list[:50],  # Limitar a 50 para no saturar la BD
             'total_count': len(headings_list),
-            'by_level': {
-                f'h{i}': sum(1 for h in headings_list if h['level'] == i)
-                for i in range(1, 7)
-            },
+            'by_level': by_level,
             'h1_count': h1_count,
             'has_single_h1': h1_count == 1,
-            'hierarchy_valid': hierarchy_valid,
+            'hierarchy_valid': not hierarchy_errors,
             'hierarchy_errors': hierarchy_errors,
-            'empty_headings': sum(1 for h in headings_list if h['is_empty'])
+            'empty_headings': empty_headings
         }
 
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+    def _extract_images(self, elements: Dict[str, List[Any]], base_url: str) -> Dict[str, Any]:
         """
         Extrae información de imágenes.
 
@@ -714,17 +1371,26 @@ class GobBoCrawler:
         - FMT-02: Imágenes optimizadas (dimensiones razonables)
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
             base_url: URL base para resolver URLs relativas
 
         Returns:
             dict: Información sobre las imágenes
         """
         images_list = []
+        images_with_alt = 0
 
-        for img in soup.find_all('img'):
+        for img in elements['img']:
             src = img.get('src', '')
             alt = img.get('alt', '')
+            has_alt = 'alt' in img.attrib
+            if has_alt and alt != '':
+                images_with_alt += 1
+
+            # Solo se devuelven 100 imágenes: del resto basta con contarlas
+            if len(images_list) >= 100:
+                continue
+
             width = img.get('width', '')
             height = img.get('height', '')
 
@@ -743,7 +1409,7 @@ class GobBoCrawler:
                 'src': src,
                 'absolute_src': urljoin(base_url, src) if src else '',
                 'alt': alt,
-                'has_alt': 'alt' in img.attrs,
+                'has_alt': has_alt,
                 'alt_empty': alt == '',
                 'alt_length': len(alt),
                 'width': width_num,
@@ -752,19 +1418,18 @@ class GobBoCrawler:
             })
 
         # Calcular estadísticas
-        total_images = len(images_list)
-        images_with_alt = sum(1 for img in images_list if img['has_alt'] and not img['alt_empty'])
+        total_images = len(elements['img'])
         images_without_alt = total_images - images_with_alt
 
         return {
-            'images': images_list[:100],  # Limitar a 100
+            'images': images_list,  # Limitado a 100
             'total_count': total_images,
             'with_alt': images_with_alt,
             'without_alt': images_without_alt,
             'alt_compliance_percentage': (images_with_alt / total_images * 100) if total_images > 0 else 0
         }
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+    def _extract_links(self, tags: Dict[str, List[Any]], base_url: str) -> Dict[str, Any]:
         """
         Extrae y clasifica enlaces.
 
@@ -777,7 +1442,7 @@ class GobBoCrawler:
         - PART-05: Botones compartir en RRSS
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tags: Etiquetas de BeautifulSoup agrupadas por nombre (_index_tags)
             base_url: URL base para resolver URLs relativas
 
         Returns:
@@ -792,24 +1457,19 @@ class GobBoCrawler:
         generic_text_links = []
         empty_links = []  # Enlaces sin texto
 
-        for link in soup.find_all('a', href=True):
+        for link in tags['a']:
+            if 'href' not in link.attrs:
+                continue
             href = link.get('href', '').strip()
             text = link.get_text().strip()
             title = link.get('title', '').strip()
 
             absolute_url = urljoin(base_url, href) if href else ''
-            parsed = urlparse(absolute_url.lower())
 
             # Detectar enlaces vacíos (ACC-08)
             is_empty = len(text) == 0 and len(title) == 0
 
-            link_data = {
-                'href': href,
-                'text': text,
-                'title': title,
-                'absolute_url': absolute_url,
-                'is_empty': is_empty
-            }
+            link_data = _LinkRecord(href, text, title, absolute_url, is_empty)
 
             all_links.append(link_data)
 
@@ -826,58 +1486,67 @@ class GobBoCrawler:
             elif href.startswith('tel:'):
                 phone_links.append(link_data)
 
-            # PART-01: Redes sociales
-            elif any(domain in parsed.netloc for domain in self.SOCIAL_DOMAINS):
-                social_links.append(link_data)
+            else:
+                host = _url_host(absolute_url)
+
+                # PART-01: Redes sociales
+                if self.SOCIAL_RE.search(host):
+                    social_links.append(link_data)
 
-            # PART-02: Mensajería
-            elif any(domain in parsed.netloc for domain in self.MESSAGING_DOMAINS):
-                messaging_links.append(link_data)
+                # PART-02: Mensajería
+                elif self.MESSAGING_RE.search(host):
+                    messaging_links.append(link_data)
 
             # ACC-08: Textos genéricos
-            if text.lower() in self.GENERIC_LINK_TEXTS:
+            if text and text.lower() in self.GENERIC_LINK_TEXTS:
                 generic_text_links.append(link_data)
 
-            # PART-05: Botones compartir (buscar en atributos y clases)
-            link_attrs = ' '.join([str(v) for v in link.attrs.values()]).lower()
-            if 'share' in link_attrs or 'compartir' in link_attrs:
+            # PART-05: Botones compartir (buscar en atributos y clases).
+            # Todos los valores se unen y se pasan a minúsculas una sola vez;
+            # los patrones no contienen espacios, no hay coincidencias entre valores
+            attr_text = ' '.join(
+                # Los atributos multivalor (class, rel) llegan como lista
+                value if isinstance(value, str) else ' '.join(value)
+                for value in link.attrs.values()
+            )
+            if _SHARE_RE.search(attr_text.lower()):
                 share_buttons.append(link_data)
 
         return {
-            'all_links': all_links[:200],  # Limitar a 200
+            'all_links': _links_to_dicts(all_links[:200]),  # Limitar a 200
             'total_count': len(all_links),
             'empty_links': {
-                'links': empty_links[:20],  # Limitar a 20 ejemplos
+                'links': _links_to_dicts(empty_links[:20]),  # Limitar a 20 ejemplos
                 'count': len(empty_links)
             },
             'social': {
-                'links': social_links,
+                'links': _links_to_dicts(social_links),
                 'count': len(social_links),
-                'unique_platforms': len(set(urlparse(l['absolute_url']).netloc for l in social_links))
+                'unique_platforms': len(set(urlparse(l.absolute_url).netloc for l in social_links))
             },
             'messaging': {
-                'links': messaging_links,
+                'links': _links_to_dicts(messaging_links),
                 'count': len(messaging_links)
             },
             'email': {
-                'links': email_links,
+                'links': _links_to_dicts(email_links),
                 'count': len(email_links)
             },
             'phone': {
-                'links': phone_links,
+                'links': _links_to_dicts(phone_links),
                 'count': len(phone_links)
             },
             'share_buttons': {
-                'links': share_buttons,
+                'links': _links_to_dicts(share_buttons),
                 'count': len(share_buttons)
             },
             'generic_text': {
-                'links': generic_text_links[:20],
+                'links': _links_to_dicts(generic_text_links[:20]),
                 'count': len(generic_text_links)
             }
         }
 
-    def _extract_forms(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_forms(self, tags: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Extrae información de formularios.
 
@@ -885,7 +1554,7 @@ class GobBoCrawler:
         - ACC-07: Etiquetas en formularios (<label> asociado a <input>)
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tags: Etiquetas de BeautifulSoup agrupadas por nombre (_index_tags)
 
         Returns:
             dict: Información sobre formularios
@@ -894,7 +1563,39 @@ class GobBoCrawler:
         total_inputs = 0
         inputs_with_label = 0
 
-        for form in soup.find_all('form'):
+        forms = tags['form']
+
+        # Índice for -> primer <label> del documento con ese 'for', construido
+        # una sola vez en lugar de buscar en todo el DOM por cada input
+        label_by_for = {}
+        if forms:
+            for label in tags['label']:
+                if 'for' in label.attrs:
+                    label_by_for.setdefault(label['for'], label)
+
+        # Para el método 3: por cada contenedor, el último <label> hermano que
+        # precede a cada hijo. Se calcula una vez por contenedor en lugar de
+        # recorrer hacia atrás los hermanos de cada input
+        previous_label_by_parent: Dict[int, Dict[int, Any]] = {}
+
+        def previous_sibling_label(elem):
+            parent = elem.parent
+            if parent is None:
+                return None
+            previous_labels = previous_label_by_parent.get(id(parent))
+            if previous_labels is None:
+                previous_labels = {}
+                last_label = None
+                for child in parent.children:
+                    if child.name is None:
+                        continue
+                    previous_labels[id(child)] = last_label
+                    if child.name == 'label':
+                        last_label = child
+                previous_label_by_parent[id(parent)] = previous_labels
+            return previous_labels.get(id(elem))
+
+        for form in forms:
             # FIX: Buscar inputs tanto dentro como alrededor del form
             inputs = form.find_all(['input', 'select', 'textarea'])
             form_inputs = []
@@ -915,7 +1616,7 @@ class GobBoCrawler:
 
                 # Método 1: Buscar por atributo 'for' en todo el documento
                 if input_id:
-                    label = soup.find('label', attrs={'for': input_id})
+                    label = label_by_for.get(input_id)
                     if label:
                         has_label = True
                         label_text = label.get_text(strip=True)
@@ -929,7 +1630,7 @@ class GobBoCrawler:
 
                 # Método 3: Buscar label hermano anterior (común en algunos frameworks)
                 if not has_label:
-                    prev_sibling = input_elem.find_previous_sibling('label')
+                    prev_sibling = previous_sibling_label(input_elem)
                     if prev_sibling:
                         has_label = True
                         label_text = prev_sibling.get_text(strip=True)
@@ -969,7 +1670,7 @@ class GobBoCrawler:
             'label_compliance_percentage': (inputs_with_label / total_inputs * 100) if total_inputs > 0 else 0
         }
 
-    def _extract_media(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_media(self, elements: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Extrae información de elementos multimedia.
 
@@ -977,29 +1678,32 @@ class GobBoCrawler:
         - ACC-05: Sin auto reproducción multimedia
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             dict: Información sobre elementos multimedia
         """
         audio_elements = []
         video_elements = []
+        audio_with_autoplay = 0
+        video_with_autoplay = 0
 
-        for audio in soup.find_all('audio'):
+        for audio in elements['audio']:
+            has_autoplay = 'autoplay' in audio.attrib
+            audio_with_autoplay += has_autoplay
             audio_elements.append({
                 'src': audio.get('src', ''),
-                'has_autoplay': audio.has_attr('autoplay')
+                'has_autoplay': has_autoplay
             })
 
-        for video in soup.find_all('video'):
+        for video in elements['video']:
+            has_autoplay = 'autoplay' in video.attrib
+            video_with_autoplay += has_autoplay
             video_elements.append({
                 'src': video.get('src', ''),
-                'has_autoplay': video.has_attr('autoplay')
+                'has_autoplay': has_autoplay
             })
 
-        audio_with_autoplay = sum(1 for a in audio_elements if a['has_autoplay'])
-        video_with_autoplay = sum(1 for v in video_elements if v['has_autoplay'])
-
         return {
             'audio': {
                 'elements': audio_elements,
@@ -1014,9 +1718,17 @@ class GobBoCrawler:
             'has_autoplay_media': audio_with_autoplay > 0 or video_with_autoplay > 0
         }
 
-    def _extract_external_resources(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+    def _extract_resources(
+        self,
+        elements: Dict[str, List[Any]],
+        base_url: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
         """
-        Extrae información de recursos externos.
+        Extrae recursos externos, hojas de estilo y scripts en una sola pasada.
+
+        Cada <link>, <script> e <iframe> se visita una vez; la URL absoluta y
+        el dominio de cada recurso se calculan una sola vez y se reparten entre
+        las tres clasificaciones.
 
         Evalúa criterios:
         - PROH-01: Sin iframes externos
@@ -1025,22 +1737,26 @@ class GobBoCrawler:
         - PROH-04: Sin trackers externos
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
             base_url: URL base del sitio
 
         Returns:
-            dict: Información sobre recursos externos
+            tuple: (recursos externos, hojas de estilo, scripts)
         """
-        base_domain = urlparse(base_url).netloc.lower()
+        base_domain = _cached_urlparse(base_url).netloc.lower()
+        # Sufijo y método ligados a locales: se evalúan para cada iframe/link/script
+        gob_suffix = '.gob.bo'
+        ends_with = str.endswith
 
         # PROH-01: iframes externos
         external_iframes = []
-        for iframe in soup.find_all('iframe', src=True):
+        for iframe in elements['iframe']:
+            if 'src' not in iframe.attrib:
+                continue
             src = iframe.get('src', '')
-            absolute_src = urljoin(base_url, src)
-            iframe_domain = urlparse(absolute_src).netloc.lower()
+            absolute_src, iframe_domain = _resolve_url(base_url, src)
 
-            is_external = iframe_domain and not iframe_domain.endswith('.gob.bo')
+            is_external = iframe_domain and not ends_with(iframe_domain, gob_suffix)
 
             if is_external:
                 external_iframes.append({
@@ -1049,77 +1765,119 @@ class GobBoCrawler:
                     'domain': iframe_domain
                 })
 
-        # PROH-02: CDN externos (en scripts y links)
-        external_cdn = []
+        # PROH-02: CDN externos (primero links, luego scripts)
+        external_cdn_links = []
+        external_cdn_scripts = []
+        # PROH-03: Fuentes externas
+        external_fonts = []
+        stylesheets = []
+        external_stylesheets_count = 0
+
+        for link in elements['link']:
+            attrib = link.attrib
+            # rel es multivalor: basta con que incluya 'stylesheet'
+            rel = link.get('rel', '').split()
+            is_stylesheet = 'stylesheet' in rel
+            if 'href' not in attrib and not is_stylesheet:
+                continue
 
-        for link in soup.find_all('link', href=True):
             href = link.get('href', '')
-            absolute_href = urljoin(base_url, href)
-            link_domain = urlparse(absolute_href).netloc.lower()
+            absolute_href, link_domain = _resolve_url(base_url, href)
+            is_gob_bo = ends_with(link_domain, gob_suffix)
+
+            if 'href' in attrib:
+                if link_domain and link_domain != base_domain and not is_gob_bo:
+                    external_cdn_links.append({
+                        'src': href,
+                        'absolute_src': absolute_href,
+                        'domain': link_domain,
+                        'type': 'link',
+                        'rel': rel
+                    })
 
-            is_external = link_domain and link_domain != base_domain and not link_domain.endswith('.gob.bo')
+                if self.FONT_RE.search(absolute_href.lower()):
+                    external_fonts.append({
+                        'src': href,
+                        'absolute_src': absolute_href
+                    })
 
-            if is_external:
-                external_cdn.append({
-                    'src': href,
-                    'absolute_src': absolute_href,
+            if is_stylesheet:
+                is_external = link_domain and link_domain != base_domain
+                if is_external:
+                    external_stylesheets_count += 1
+                stylesheets.append({
+                    'href': href,
+                    'absolute_href': absolute_href,
                     'domain': link_domain,
-                    'type': 'link',
-                    'rel': link.get('rel', [])
+                    'is_external': is_external,
+                    'is_gob_bo': is_gob_bo,
+                    'media': link.get('media', 'all')
                 })
 
-        for script in soup.find_all('script', src=True):
-            src = script.get('src', '')
-            absolute_src = urljoin(base_url, src)
-            script_domain = urlparse(absolute_src).netloc.lower()
-
-            is_external = script_domain and script_domain != base_domain and not script_domain.endswith('.gob.bo')
+        # PROH-04: Trackers
+        trackers_found = []
+        scripts = []
+        inline_scripts_count = 0
+        external_scripts_count = 0
+
+        for script in elements['script']:
+            attrib = script.attrib
+
+            if 'src' in attrib:
+                src = attrib['src']
+                absolute_src, script_domain = _resolve_url(base_url, src)
+                is_external = script_domain and script_domain != base_domain
+                is_gob_bo = ends_with(script_domain, gob_suffix)
+                if is_external:
+                    external_scripts_count += 1
+
+                if is_external and not is_gob_bo:
+                    external_cdn_scripts.append({
+                        'src': src,
+                        'absolute_src': absolute_src,
+                        'domain': script_domain,
+                        'type': 'script'
+                    })
 
-            if is_external:
-                external_cdn.append({
+                scripts.append({
                     'src': src,
                     'absolute_src': absolute_src,
                     'domain': script_domain,
-                    'type': 'script'
-                })
-
-        # PROH-03: Fuentes externas
-        external_fonts = []
-        for link in soup.find_all('link', href=True):
-            href = link.get('href', '')
-            absolute_href = urljoin(base_url, href)
-
-            if any(font_domain in absolute_href.lower() for font_domain in self.FONT_DOMAINS):
-                external_fonts.append({
-                    'src': href,
-                    'absolute_src': absolute_href
+                    'is_external': is_external,
+                    'is_gob_bo': is_gob_bo,
+                    'type': script.get('type', 'text/javascript'),
+                    'async': 'async' in attrib,
+                    'defer': 'defer' in attrib
                 })
+            else:
+                src = ''
+                inline_scripts_count += 1
 
-        # PROH-04: Trackers
-        trackers_found = []
-
-        for script in soup.find_all('script'):
-            src = script.get('src', '')
-            script_content = script.string or ''
-
-            # Verificar en src
-            if src and any(tracker in src.lower() for tracker in self.TRACKER_PATTERNS):
+            # Verificar en src. El nombre reportado es el primer patrón de la
+            # lista presente (no el primero en el texto), solo se busca si hay match
+            src_lower = src.lower()
+            if src and self.TRACKER_RE.search(src_lower):
                 trackers_found.append({
                     'type': 'script_src',
                     'src': src,
-                    'tracker': next(t for t in self.TRACKER_PATTERNS if t in src.lower())
+                    'tracker': next(t for t in self.TRACKER_PATTERNS if t in src_lower)
                 })
+                continue
 
             # Verificar en contenido inline
-            elif any(tracker in script_content.lower() for tracker in self.TRACKER_PATTERNS):
-                tracker_match = next(t for t in self.TRACKER_PATTERNS if t in script_content.lower())
+            script_content = script.text or ''
+            content_lower = script_content.lower()
+            if self.TRACKER_RE.search(content_lower):
+                tracker_match = next(t for t in self.TRACKER_PATTERNS if t in content_lower)
                 trackers_found.append({
                     'type': 'inline_script',
                     'tracker': tracker_match,
                     'snippet': script_content[:200]
                 })
 
-        return {
+        external_cdn = external_cdn_links + external_cdn_scripts
+
+        external_resources = {
             'iframes': {
                 'external': external_iframes,
                 'count': len(external_iframes)
@@ -1139,91 +1897,24 @@ class GobBoCrawler:
             }
         }
 
-    def _extract_stylesheets(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, Any]]:
-        """
-        Extrae información de hojas de estilo.
-
-        Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
-            base_url: URL base del sitio
-
-        Returns:
-            list: Lista de hojas de estilo con clasificación
-        """
-        base_domain = urlparse(base_url).netloc.lower()
-        stylesheets = []
-
-        for link in soup.find_all('link', rel='stylesheet'):
-            href = link.get('href', '')
-            absolute_href = urljoin(base_url, href)
-            css_domain = urlparse(absolute_href).netloc.lower()
-
-            is_external = css_domain and css_domain != base_domain
-            is_gob_bo = css_domain.endswith('.gob.bo')
-
-            stylesheets.append({
-                'href': href,
-                'absolute_href': absolute_href,
-                'domain': css_domain,
-                'is_external': is_external,
-                'is_gob_bo': is_gob_bo,
-                'media': link.get('media', 'all')
-            })
-
-        # Contar estilos inline
-        inline_styles_count = len(soup.find_all('style'))
-
-        return {
+        stylesheets_data = {
             'stylesheets': stylesheets,
             'count': len(stylesheets),
-            'inline_styles_count': inline_styles_count,
-            'external_count': sum(1 for s in stylesheets if s['is_external'])
+            # Contar estilos inline
+            'inline_styles_count': len(elements['style']),
+            'external_count': external_stylesheets_count
         }
 
-    def _extract_scripts(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, Any]]:
-        """
-        Extrae información de scripts.
-
-        Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
-            base_url: URL base del sitio
-
-        Returns:
-            list: Lista de scripts con clasificación
-        """
-        base_domain = urlparse(base_url).netloc.lower()
-        scripts = []
-
-        for script in soup.find_all('script', src=True):
-            src = script.get('src', '')
-            absolute_src = urljoin(base_url, src)
-            script_domain = urlparse(absolute_src).netloc.lower()
-
-            is_external = script_domain and script_domain != base_domain
-            is_gob_bo = script_domain.endswith('.gob.bo')
-
-            scripts.append({
-                'src': src,
-                'absolute_src': absolute_src,
-                'domain': script_domain,
-                'is_external': is_external,
-                'is_gob_bo': is_gob_bo,
-                'type': script.get('type', 'text/javascript'),
-                'async': script.has_attr('async'),
-                'defer': script.has_attr('defer')
-            })
-
-        # Contar scripts inline
-        inline_scripts_count = len(soup.find_all('script', src=False))
-
-        return {
+        scripts_data = {
             'scripts': scripts,
             'count': len(scripts),
             'inline_scripts_count': inline_scripts_count,
-            'external_count': sum(1 for s in scripts if s['is_external'])
+            'external_count': external_scripts_count
         }
 
-    def _extract_language_parts(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        return external_resources, stylesheets_data, scripts_data
+
+    def _extract_language_parts(self, tree: lxml_html.HtmlElement) -> Dict[str, Any]:
         """
         ACC-10: Detecta elementos con idioma diferente al de la página.
 
@@ -1233,21 +1924,20 @@ class GobBoCrawler:
         Ejemplo: <p lang="en">Welcome</p> en página en español
 
         Args:
-            soup: Objeto BeautifulSoup con el HTML parseado
+            tree: Raíz lxml del documento parseado
 
         Returns:
             dict: Información sobre idiomas encontrados en la página
         """
         # Idioma principal de la página
-        html_tag = soup.find('html')
-        main_lang = html_tag.get('lang', '').lower() if html_tag else ''
+        main_lang = tree.get('lang', '').lower() if tree.tag == 'html' else ''
 
         # Si no hay idioma principal, asumir español para sitios .gob.bo
         if not main_lang:
             main_lang = 'es'
 
         # Buscar todos los elementos con atributo lang
-        lang_elements = soup.find_all(attrs={'lang': True})
+        lang_elements = _LANG_ELEMENTS_XPATH(tree)
 
         # Filtrar elementos con idioma DIFERENTE al principal
         different_lang_elements = []
@@ -1255,7 +1945,7 @@ class GobBoCrawler:
             elem_lang = elem.get('lang', '').lower().strip()
 
             # Ignorar <html> (ya contado como principal)
-            if elem.name == 'html':
+            if elem.tag == 'html':
                 continue
 
             # Ignorar si está vacío
@@ -1267,10 +1957,10 @@ class GobBoCrawler:
                 continue
 
             # Obtener texto preview
-            text_preview = elem.get_text(strip=True)[:100]
+            text_preview = _element_text(elem, strip=True)[:100]
 
             different_lang_elements.append({
-                'tag': elem.name,
+                'tag': elem.tag,
                 'lang': elem_lang,
                 'text_preview': text_preview,
                 'text_length': len(text_preview)
@@ -1291,7 +1981,7 @@ class GobBoCrawler:
             'acc_10_compliant': bool(main_lang) and len(main_lang) >= 2
         }
 
-    def _extract_breadcrumbs(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_breadcrumbs(self, soup: BeautifulSoup, tags: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         NAV-02: Detecta breadcrumbs (migas de pan).
 
@@ -1306,6 +1996,7 @@ class GobBoCrawler:
 
         Args:
             soup: Objeto BeautifulSoup con el HTML parseado
+            tags: Etiquetas de BeautifulSoup agrupadas por nombre (_index_tags)
 
         Returns:
             dict: Información sobre breadcrumbs encontrados
@@ -1318,7 +2009,11 @@ class GobBoCrawler:
         }
 
         # Patrón 1: <nav aria-label="breadcrumb"> o similar
-        breadcrumb_nav = soup.find('nav', attrs={'aria-label': re.compile(r'breadcrumb|migas|ruta', re.I)})
+        breadcrumb_nav = next(
+            (nav for nav in tags['nav']
+             if 'aria-label' in nav.attrs and _BREADCRUMB_LABEL_RE.search(nav['aria-label'])),
+            None
+        )
         if breadcrumb_nav:
             items = breadcrumb_nav.find_all('a')
             if items:
@@ -1332,7 +2027,7 @@ class GobBoCrawler:
                 return breadcrumbs_data
 
         # Patrón 2: <ol class="breadcrumb"> o <ul class="breadcrumb">
-        breadcrumb_list = soup.find(['ol', 'ul'], class_=re.compile(r'breadcrumb', re.I))
+        breadcrumb_list = soup.find(['ol', 'ul'], class_=_BREADCRUMB_CLASS_RE)
         if breadcrumb_list:
             items = breadcrumb_list.find_all('a')
             if items:
@@ -1346,9 +2041,9 @@ class GobBoCrawler:
                 return breadcrumbs_data
 
         # Patrón 3: Schema.org BreadcrumbList
-        breadcrumb_schema = soup.find(attrs={'itemtype': re.compile(r'schema\.org/BreadcrumbList', re.I)})
+        breadcrumb_schema = soup.find(attrs={'itemtype': _BREADCRUMB_LIST_SCHEMA_RE})
         if breadcrumb_schema:
-            list_items = breadcrumb_schema.find_all(attrs={'itemtype': re.compile(r'schema\.org/ListItem', re.I)})
+            list_items = breadcrumb_schema.find_all(attrs={'itemtype': _LIST_ITEM_SCHEMA_RE})
             if list_items:
                 breadcrumbs_data['has_breadcrumbs'] = True
                 breadcrumbs_data['breadcrumb_type'] = 'schema.org'
@@ -1365,7 +2060,7 @@ class GobBoCrawler:
                 return breadcrumbs_data
 
         # Patrón 4: JSON-LD BreadcrumbList
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        json_ld_scripts = [s for s in tags['script'] if s.get('type') == 'application/ld+json']
         for script in json_ld_scripts:
             try:
                 import json
@@ -1389,7 +2084,7 @@ class GobBoCrawler:
 
         # Patrón 5: Búsqueda genérica en <nav> con separadores típicos
         # IMPORTANTE: Solo considerar navs pequeños (breadcrumbs típicamente tienen 2-8 items)
-        for nav in soup.find_all('nav'):
+        for nav in tags['nav']:
             nav_text = nav.get_text()
             links = nav.find_all('a')
 
@@ -1407,7 +2102,7 @@ class GobBoCrawler:
                 return breadcrumbs_data
 
         # Patrón 6: Div o span con clase que contenga "breadcrumb"
-        breadcrumb_div = soup.find(['div', 'span'], class_=re.compile(r'breadcrumb', re.I))
+        breadcrumb_div = soup.find(['div', 'span'], class_=_BREADCRUMB_CLASS_RE)
         if breadcrumb_div:
             items = breadcrumb_div.find_all('a')
             if items:
@@ -1422,12 +2117,12 @@ class GobBoCrawler:
 
         return breadcrumbs_data
 
-    def _extract_document_hierarchy(self, soup: BeautifulSoup) -> Dict:
+    def _extract_document_hierarchy(self, tags: Dict[str, List[Any]]) -> Dict:
         """
         Extrae la jerarquía completa de elementos semánticos
         Para validar estructura correcta según HTML5
         """
-        body = soup.find('body')
+        body = _first_tag(tags, 'body')
         if not body:
             return {}
 
@@ -1453,10 +2148,10 @@ class GobBoCrawler:
         hierarchy = get_element_hierarchy(body)
 
         # Análisis de la estructura
-        header_elements = soup.find_all('header')
-        main_elements = soup.find_all('main')
-        footer_elements = soup.find_all('footer')
-        nav_elements = soup.find_all('nav')
+        header_elements = tags['header']
+        main_elements = tags['main']
+        footer_elements = tags['footer']
+        nav_elements = tags['nav']
 
         # Verificar ubicación de nav
         navs_in_header = 0
@@ -1489,8 +2184,10 @@ class GobBoCrawler:
                 parent = parent.parent
 
         # Contar divs vs elementos semánticos
-        total_divs = len(soup.find_all('div'))
-        total_semantic = len(soup.find_all(['header', 'nav', 'main', 'footer', 'section', 'article', 'aside']))
+        total_divs = len(tags['div'])
+        total_semantic = sum(
+            len(tags[tag]) for tag in ['header', 'nav', 'main', 'footer', 'section', 'article', 'aside']
+        )
 
         div_ratio = total_divs / (total_divs + total_semantic) if (total_divs + total_semantic) > 0 else 0
 
@@ -1512,7 +2209,12 @@ class GobBoCrawler:
             }
         }
 
-    def _extract_text_corpus(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_text_corpus(
+        self,
+        soup: BeautifulSoup,
+        tags: Dict[str, List[Any]],
+        elements: Dict[str, List[Any]]
+    ) -> Dict[str, Any]:
         """
         Extrae corpus textual completo para análisis NLP.
 
@@ -1524,13 +2226,15 @@ class GobBoCrawler:
 
         Args:
             soup: Objeto BeautifulSoup con el HTML parseado
+            tags: Etiquetas de BeautifulSoup agrupadas por nombre (_index_tags)
+            elements: Elementos del documento agrupados por etiqueta (_index_elements)
 
         Returns:
             dict: Corpus textual estructurado para análisis NLP
         """
         # 1. TEXTO DEL HEADER (para IDEN-02)
         header_text = ""
-        header = soup.find('header')
+        header = _first_tag(tags, 'header')
         if header:
             header_text = header.get_text(separator=' ', strip=True)
 
@@ -1539,19 +2243,19 @@ class GobBoCrawler:
 
         # 1.5. TEXTO DEL FOOTER (para PART-01 datos de contacto)
         footer_text = ""
-        footer = soup.find('footer')
+        footer = _first_tag(tags, 'footer')
         if footer:
             footer_text = footer.get_text(separator=' ', strip=True)
 
         # 2. TÍTULO DE LA PÁGINA
         title_text = ''
-        title_tag = soup.find('title')
+        title_tag = _first_tag(tags, 'title')
         if title_tag:
             title_text = title_tag.get_text(strip=True)
 
         # 3. META DESCRIPTION
         meta_desc = ''
-        head = soup.find('head')
+        head = _first_tag(tags, 'head')
         if head:
             meta_tag = head.find('meta', {'name': 'description'})
             if meta_tag:
@@ -1561,6 +2265,20 @@ class GobBoCrawler:
         # Para análisis de coherencia: ¿el contenido corresponde al título de la sección?
         sections = []
         processed_headings = set()  # Para evitar duplicados
+        parent_text_cache: Dict[int, str] = {}  # Texto de cada contenedor padre (Estrategia 2)
+        parent_text_offsets: Dict[int, int] = {}  # Fin del último heading hallado en ese texto
+
+        # get_text(strip=True) por nodo: los mismos hermanos, listas y divs se
+        # recorren desde varios headings de la misma zona
+        stripped_text_cache: Dict[int, str] = {}
+
+        def stripped_text(node) -> str:
+            node_key = id(node)
+            text = stripped_text_cache.get(node_key)
+            if text is None:
+                text = node.get_text(strip=True)
+                stripped_text_cache[node_key] = text
+            return text
 
         for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
             heading_text = heading.get_text(strip=True)
@@ -1588,15 +2306,17 @@ class GobBoCrawler:
 
                 # Extraer de párrafos
                 if current.name == 'p':
-                    p_text = current.get_text(strip=True)
+                    p_text = stripped_text(current)
                     if len(p_text) > 20:
                         paragraphs.append(p_text)
                         found_content = True
 
                 # Extraer de listas
                 elif current.name in ['ul', 'ol']:
-                    for li in current.find_all('li'):
-                        li_text = li.get_text(strip=True)
+                    # Solo los <li> directos: el texto de un <li> ya incluye
+                    # el de sus sublistas, recorrerlas repetiría ese texto
+                    for li in current.find_all('li', recursive=False):
+                        li_text = stripped_text(li)
                         if len(li_text) > 10:
                             paragraphs.append(li_text)
                             found_content = True
@@ -1605,14 +2325,14 @@ class GobBoCrawler:
                 elif current.name == 'div':
                     # Buscar párrafos dentro del div
                     for p in current.find_all('p', recursive=True):
-                        p_text = p.get_text(strip=True)
+                        p_text = stripped_text(p)
                         if len(p_text) > 20:
                             paragraphs.append(p_text)
                             found_content = True
 
                     # Si no hay párrafos, tomar texto directo del div
                     if not found_content:
-                        div_text = current.get_text(strip=True)
+                        div_text = stripped_text(current)
                         if len(div_text) > 20 and len(div_text) < 800:
                             paragraphs.append(div_text)
                             found_content = True
@@ -1623,10 +2343,17 @@ class GobBoCrawler:
             if not found_content:
                 parent = heading.parent
                 if parent:
-                    # Obtener todo el texto del padre excluyendo el heading mismo
-                    parent_text = parent.get_text(separator=' ', strip=True)
-                    heading_start = parent_text.find(heading_text)
+                    # Obtener todo el texto del padre excluyendo el heading mismo.
+                    # Se materializa una vez por padre; los headings llegan en orden
+                    # del documento, así que la búsqueda continúa donde terminó la anterior
+                    parent_key = id(parent)
+                    parent_text = parent_text_cache.get(parent_key)
+                    if parent_text is None:
+                        parent_text = parent.get_text(separator=' ', strip=True)
+                        parent_text_cache[parent_key] = parent_text
+                    heading_start = parent_text.find(heading_text, parent_text_offsets.get(parent_key, 0))
                     if heading_start != -1:
+                        parent_text_offsets[parent_key] = heading_start + len(heading_text)
                         content_after_heading = parent_text[heading_start + len(heading_text):].strip()
                         if len(content_after_heading) > 20:
                             # Dividir en fragmentos de ~200 caracteres
@@ -1656,18 +2383,18 @@ class GobBoCrawler:
                         break
 
                     if elem.name == 'p':
-                        p_text = elem.get_text(strip=True)
+                        p_text = stripped_text(elem)
                         if len(p_text) > 15:
                             paragraphs.append(p_text)
                             found_content = True
                     elif elem.name in ['ul', 'ol']:
                         for li in elem.find_all('li', recursive=False):
-                            li_text = li.get_text(strip=True)
+                            li_text = stripped_text(li)
                             if len(li_text) > 10:
                                 paragraphs.append(li_text)
                                 found_content = True
                     elif elem.name in ['div', 'span']:
-                        elem_text = elem.get_text(strip=True)
+                        elem_text = stripped_text(elem)
                         # Solo tomar divs con texto sustancial pero no enormes
                         if 15 < len(elem_text) < 500 and not elem.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
                             paragraphs.append(elem_text)
@@ -1688,7 +2415,7 @@ class GobBoCrawler:
 
         # 5. TEXTO DE NAVEGACIÓN
         nav_texts = []
-        for nav in soup.find_all('nav'):
+        for nav in tags['nav']:
             for link in nav.find_all('a'):
                 text = link.get_text(strip=True)
                 if text and len(text) > 0:
@@ -1696,20 +2423,23 @@ class GobBoCrawler:
 
         # 6. TEXTO DE ENLACES (para detectar textos genéricos - claridad)
         link_texts = []
-        generic_phrases = [
-            'clic aquí', 'haz clic', 'click aquí', 'aquí',
-            'ver más', 'leer más', 'más información', 'continuar',
-            'siguiente', 'anterior', 'atrás', 'más', 'click here',
-            'here', 'read more', 'more'
-        ]
-
-        for a in soup.find_all('a', href=True):
+        # Contadores acumulados en el mismo recorrido (evita re-filtrar la lista)
+        generic_links_count = 0
+        generic_link_examples = []
+
+        for a in tags['a']:
+            if 'href' not in a.attrs:
+                continue
             text = a.get_text(strip=True)
             href = a.get('href', '')
             title = a.get('title', None)
 
             if text:
-                is_generic = any(phrase in text.lower() for phrase in generic_phrases)
+                is_generic = self.GENERIC_PHRASES_RE.search(text.lower()) is not None
+                if is_generic:
+                    generic_links_count += 1
+                    if len(generic_link_examples) < 20:
+                        generic_link_examples.append(text)
                 link_texts.append({
                     'text': text,
                     'url': href[:100],  # Renombrado de 'href' a 'url' para NLP
@@ -1730,23 +2460,21 @@ class GobBoCrawler:
 
         # 8. ETIQUETAS DE FORMULARIOS
         label_texts = []
-        for label in soup.find_all('label'):
+        for label in tags['label']:
             text = label.get_text(strip=True)
             if text:
                 label_texts.append(text)
 
         # 9. TODO EL TEXTO VISIBLE (para análisis general)
-        # Crear una copia para no modificar el original
-        soup_copy = BeautifulSoup(str(soup), 'html.parser')
-
-        # Eliminar scripts y estilos
-        for element in soup_copy(['script', 'style', 'noscript']):
-            element.decompose()
-
-        body = soup_copy.find('body')
+        # Directamente del árbol lxml, sin copiar ni modificar el documento:
+        # los textos de scripts, estilos y noscript se descartan en el XPath
         full_text = ''
-        if body:
-            full_text = body.get_text(separator=' ', strip=True)
+        if elements['body']:
+            full_text = ' '.join(
+                stripped
+                for stripped in map(str.strip, _VISIBLE_TEXT_XPATH(elements['body'][0]))
+                if stripped
+            )
 
         # 10. ESTADÍSTICAS
         total_words = len(full_text.split())
@@ -1762,7 +2490,8 @@ class GobBoCrawler:
             # Secciones para análisis de coherencia
             'sections': sections[:30],  # Aumentado de 20
             'total_sections': len(sections),
-            'sections_with_content': len([s for s in sections if len(s['paragraphs']) > 0]),
+            # Solo se agregan secciones con párrafos, todas tienen contenido
+            'sections_with_content': len(sections),
 
             # Navegación
             'navigation_texts': nav_texts[:100],  # Aumentado de 50
@@ -1771,8 +2500,8 @@ class GobBoCrawler:
             # Enlaces (para análisis de claridad)
             'link_texts': link_texts[:200],  # Aumentado de 100
             'total_links': len(link_texts),
-            'generic_links': len([l for l in link_texts if l['is_generic']]),
-            'generic_link_examples': [l['text'] for l in link_texts if l['is_generic']][:20],
+            'generic_links': generic_links_count,
+            'generic_link_examples': generic_link_examples,
 
             # Botones
             'button_texts': button_texts[:50],  # Aumentado de 30
@@ -1787,3 +2516,15 @@ class GobBoCrawler:
             'total_words': total_words,
             'total_characters': len(full_text)
         }
+
+
+# Crawler de cada proceso del pool de crawl_many(); se crea en la primera página
+_worker_crawler: Optional[GobBoCrawler] = None
+
+
+def _parse_fetched_page(timeout: int, user_agent: str, fetched: Dict[str, Any]) -> Dict[str, Any]:
+    """Extracción de una página descargada por crawl_many(), en un proceso del pool."""
+    global _worker_crawler
+    if _worker_crawler is None:
+        _worker_crawler = GobBoCrawler(timeout=timeout, user_agent=user_agent)
+    return _worker_crawler._parse(fetched['url'], fetched['html'], fetched['robots_txt'])
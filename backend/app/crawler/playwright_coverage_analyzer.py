@@ -10,14 +10,34 @@ Fecha: 2025-01-25
 """
 
 import json
-import requests
-from typing import Dict, List, Any
-from bs4 import BeautifulSoup
-from urllib3.exceptions import InsecureRequestWarning
-import warnings
-
-# Suprimir warnings de SSL
-warnings.filterwarnings('ignore', category=InsecureRequestWarning)
+import time
+import logging
+import asyncio
+import hashlib
+import httpx
+import orjson
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+from lxml import etree, html as lxml_html
+
+# HTTP/2 en httpx requiere h2 (httpx[http2] en requirements.txt); sin el se usa HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+logger = logging.getLogger(__name__)
+
+# Conteos del HTML estatico: count() se evalua en libxml2 y devuelve un float,
+# sin crear objetos Python por cada nodo
+_LINKS_COUNT_XPATH = etree.XPath('count(//a[@href])')
+_IMAGES_COUNT_XPATH = etree.XPath('count(//img)')
+_HEADINGS_COUNT_XPATH = etree.XPath('count(//h1|//h2|//h3|//h4|//h5|//h6)')
+_FORMS_COUNT_XPATH = etree.XPath('count(//form)')
+_BUTTONS_COUNT_XPATH = etree.XPath(
+    "count(//button) + count(//input[@type='submit' or @type='button' or @type='reset'])"
+)
 
 
 class PlaywrightCoverageAnalyzer:
@@ -25,7 +45,7 @@ class PlaywrightCoverageAnalyzer:
     Mide cobertura comparando extraccion con y sin JavaScript.
 
     Metodologia:
-    1. Extraccion SIN JavaScript (requests + BeautifulSoup)
+    1. Extraccion SIN JavaScript (httpx + lxml)
     2. Extraccion CON JavaScript (Playwright + BeautifulSoup)
     3. Comparar resultados para medir beneficio de Playwright
     """
@@ -45,65 +65,327 @@ class PlaywrightCoverageAnalyzer:
         'SPA': 85.0
     }
 
-    def __init__(self, timeout: int = 30):
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    # Seccion del resultado del crawler -> lista usada si 'total_count' es 0
+    # (la seccion da nombre tambien al conteo)
+    PLAYWRIGHT_COUNT_SOURCES = (
+        ('links', 'all_links'),
+        ('images', 'images'),
+        ('headings', 'headings'),
+        ('forms', 'forms'),
+    )
+
+    # Descargas de HTML estatico simultaneas en analyze_multiple_sites
+    STATIC_CONCURRENCY = 8
+
+    # Pool de conexiones httpx (keep-alive entre paginas del mismo host)
+    HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+    # Vigencia (segundos) de los conteos estaticos cacheados
+    STATIC_CACHE_TTL = 86400
+
+    # Bytes maximos de HTML estatico que se descargan y parsean por pagina
+    MAX_STATIC_BYTES = 2_000_000
+    STREAM_CHUNK_SIZE = 65536
+
+    def __init__(self, timeout: int = 30, cache_file: Optional[str] = None):
         """
         Inicializa el analizador.
 
         Args:
             timeout: Timeout en segundos para requests
+            cache_file: Archivo JSON donde persistir los conteos estaticos entre
+                ejecuciones (por defecto, cache solo en memoria)
         """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.verify = False
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = httpx.Client(**self._client_options())
+        self.cache_file = cache_file
+        self._static_cache = self._load_static_cache()
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Configuracion comun de los clientes httpx sync y async"""
+        return {
+            'http2': HAS_HTTP2,
+            'verify': False,
+            'timeout': self.timeout,
+            'limits': self.HTTP_LIMITS,
+            'headers': {'User-Agent': self.USER_AGENT},
+            'follow_redirects': True  # requests sigue redirecciones por defecto
+        }
+
+    def close(self) -> None:
+        """Cierra el cliente HTTP y guarda la cache de conteos estaticos"""
+        self.session.close()
+        self._save_static_cache()
+
+    def __enter__(self) -> 'PlaywrightCoverageAnalyzer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _empty_counts() -> Dict[str, int]:
+        """Conteos en cero cuando no se pudo obtener el HTML estatico"""
+        return {
+            'links': 0,
+            'images': 0,
+            'headings': 0,
+            'forms': 0,
+            'text_words': 0,
+            'buttons': 0
+        }
+
+    def _load_static_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Carga la cache persistida en cache_file, si existe"""
+        if not self.cache_file:
+            return {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_static_cache(self) -> None:
+        """Persiste la cache en cache_file (si se configuro)"""
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._static_cache, f)
+        except OSError as e:
+            logger.warning("No se pudo guardar la cache estatica: %s", e)
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Clave de cache: esquema y host en minusculas, sin barra final en la ruta"""
+        parts = urlsplit(url)
+        return urlunsplit((
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip('/'),
+            parts.query,
+            ''
+        ))
+
+    def _static_cache_request(self, url: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Clave de cache de la URL y cabeceras condicionales para revalidarla.
+
+        Returns:
+            tuple: (clave, cabeceras If-None-Match / If-Modified-Since)
+        """
+        key = self._normalize_url(url)
+        entry = self._static_cache.get(key)
+        headers = {}
+        if entry and time.time() - entry['stored_at'] < self.STATIC_CACHE_TTL:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return key, headers
+
+    def _cached_static_counts(
+        self,
+        key: str,
+        response: httpx.Response,
+        content: bytes
+    ) -> Tuple[Optional[Dict[str, int]], Optional[str]]:
+        """
+        Conteos cacheados si el servidor respondio 304 o el HTML no cambio.
+
+        Returns:
+            tuple: (conteos cacheados o None, hash del contenido recibido)
+        """
+        entry = self._static_cache.get(key)
+        if response.status_code == 304:
+            if entry:
+                entry['stored_at'] = time.time()
+                return entry['counts'], None
+            return None, None
+
+        content_hash = hashlib.sha1(content).hexdigest()
+        if entry and entry['content_hash'] == content_hash:
+            entry['stored_at'] = time.time()
+            return entry['counts'], content_hash
+        return None, content_hash
+
+    def _store_static_counts(
+        self,
+        key: str,
+        response: httpx.Response,
+        content_hash: str,
+        counts: Dict[str, int]
+    ) -> None:
+        """Guarda los conteos con los validadores HTTP de la respuesta"""
+        self._static_cache[key] = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'content_hash': content_hash,
+            'counts': counts,
+            'stored_at': time.time()
+        }
+
+    @staticmethod
+    def _is_html_response(response: httpx.Response) -> bool:
+        """True si la respuesta es exitosa y HTML (o no declara Content-Type)"""
+        content_type = response.headers.get('content-type', '').lower()
+        return response.is_success and (not content_type or 'html' in content_type)
+
+    @staticmethod
+    def _decode_body(response: httpx.Response, body: bytes) -> str:
+        """Decodifica el HTML descargado (puede estar cortado a mitad de un caracter)"""
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    def _read_static_body(self, response: httpx.Response) -> bytes:
+        """
+        Lee el cuerpo en streaming hasta MAX_STATIC_BYTES.
+
+        Las respuestas de error o que no son HTML no se descargan.
+        """
+        body = bytearray()
+        if self._is_html_response(response):
+            for chunk in response.iter_bytes(self.STREAM_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= self.MAX_STATIC_BYTES:
+                    break
+        return bytes(body[:self.MAX_STATIC_BYTES])
+
+    async def _read_static_body_async(self, response: httpx.Response) -> bytes:
+        """Version async de _read_static_body"""
+        body = bytearray()
+        if self._is_html_response(response):
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= self.MAX_STATIC_BYTES:
+                    break
+        return bytes(body[:self.MAX_STATIC_BYTES])
+
+    def _check_static_response(self, response: httpx.Response) -> None:
+        """Lanza excepcion si la respuesta no es un HTML utilizable"""
+        response.raise_for_status()
+        if not self._is_html_response(response):
+            raise ValueError(f"Content-Type no HTML: {response.headers.get('content-type')}")
 
     def _extract_static(self, url: str) -> Dict[str, int]:
         """
         Extrae contenido SIN JavaScript (solo HTML estatico).
 
+        Si la URL ya se analizo, se revalida con ETag/Last-Modified y se
+        reutilizan los conteos cuando el HTML no cambio. El cuerpo se descarga
+        en streaming y se corta en MAX_STATIC_BYTES.
+
         Args:
             url: URL a analizar
 
         Returns:
             dict: Conteos de elementos extraidos
         """
+        key, headers = self._static_cache_request(url)
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            static_html = response.text
+            with self.session.stream('GET', url, headers=headers, timeout=self.timeout) as response:
+                content = self._read_static_body(response)
+            cached, content_hash = self._cached_static_counts(key, response, content)
+            if cached is not None:
+                return cached
+            self._check_static_response(response)
+            static_html = self._decode_body(response, content)
         except Exception as e:
-            print(f"  [WARN] Error obteniendo HTML estatico: {e}")
-            return {
-                'links': 0,
-                'images': 0,
-                'headings': 0,
-                'forms': 0,
-                'text_words': 0,
-                'buttons': 0
-            }
+            logger.warning("Error obteniendo HTML estatico de %s: %s", url, e)
+            return self._empty_counts()
 
-        soup = BeautifulSoup(static_html, 'html.parser')
+        counts = self._count_static_elements(static_html)
+        self._store_static_counts(key, response, content_hash, counts)
+        return counts
 
-        # Eliminar scripts y estilos para contar texto
-        for element in soup(['script', 'style', 'noscript']):
-            element.decompose()
+    async def _extract_static_async(self, client: httpx.AsyncClient, url: str) -> Dict[str, int]:
+        """
+        Version async de _extract_static sobre un cliente httpx compartido.
 
-        # Contar elementos
-        links = len(soup.find_all('a', href=True))
-        images = len(soup.find_all('img'))
-        headings = len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
-        forms = len(soup.find_all('form'))
+        El parseo y conteo se ejecuta en el executor por defecto para no
+        bloquear el event loop mientras avanzan las demas descargas. Usa la
+        misma cache de conteos que _extract_static.
+
+        Args:
+            client: Cliente httpx reutilizado para todas las URLs
+            url: URL a analizar
+
+        Returns:
+            dict: Conteos de elementos extraidos
+        """
+        key, headers = self._static_cache_request(url)
+        try:
+            async with client.stream('GET', url, headers=headers) as response:
+                content = await self._read_static_body_async(response)
+            cached, content_hash = self._cached_static_counts(key, response, content)
+            if cached is not None:
+                return cached
+            self._check_static_response(response)
+            static_html = self._decode_body(response, content)
+        except Exception as e:
+            logger.warning("Error obteniendo HTML estatico de %s: %s", url, e)
+            return self._empty_counts()
+
+        loop = asyncio.get_running_loop()
+        counts = await loop.run_in_executor(None, self._count_static_elements, static_html)
+        self._store_static_counts(key, response, content_hash, counts)
+        return counts
+
+    async def _extract_static_many(self, urls: List[str]) -> List[Dict[str, int]]:
+        """
+        Extrae el HTML estatico de varias URLs en paralelo.
 
-        # Contar palabras de texto visible
-        body = soup.find('body')
-        text = body.get_text(separator=' ', strip=True) if body else ''
-        text_words = len(text.split())
+        Args:
+            urls: URLs a analizar
+
+        Returns:
+            list: Conteos por URL, en el mismo orden que `urls`
+        """
+        semaphore = asyncio.Semaphore(self.STATIC_CONCURRENCY)
+
+        async with httpx.AsyncClient(**self._client_options()) as client:
+            async def extract(url: str) -> Dict[str, int]:
+                async with semaphore:
+                    return await self._extract_static_async(client, url)
+
+            return await asyncio.gather(*(extract(url) for url in urls))
+
+    def _count_static_elements(self, static_html: str) -> Dict[str, int]:
+        """
+        Cuenta los elementos del HTML estatico.
+
+        Args:
+            static_html: HTML sin ejecutar JavaScript
+
+        Returns:
+            dict: Conteos de elementos extraidos
+        """
+        try:
+            try:
+                tree = lxml_html.document_fromstring(static_html)
+            except ValueError:
+                # lxml no acepta str con declaracion de encoding XML
+                tree = lxml_html.document_fromstring(static_html.encode('utf-8'))
+        except etree.ParserError:
+            # Documento vacio (tambien si solo trae la declaracion XML o comentarios)
+            return self._empty_counts()
+
+        # Eliminar scripts y estilos (y lo que contienen); el texto que les
+        # sigue se conserva, igual que con decompose()
+        etree.strip_elements(tree, 'script', 'style', 'noscript', with_tail=False)
+
+        # Contar elementos
+        links = int(_LINKS_COUNT_XPATH(tree))
+        images = int(_IMAGES_COUNT_XPATH(tree))
+        headings = int(_HEADINGS_COUNT_XPATH(tree))
+        forms = int(_FORMS_COUNT_XPATH(tree))
+        buttons = int(_BUTTONS_COUNT_XPATH(tree))
 
-        # Contar botones
-        buttons = len(soup.find_all('button'))
-        buttons += len(soup.find_all('input', type=['submit', 'button', 'reset']))
+        # Contar palabras de texto visible (cada nodo de texto por separado,
+        # como get_text(separator=' '))
+        body = tree.find('body')
+        text_words = sum(len(text.split()) for text in body.itertext()) if body is not None else 0
 
         return {
             'links': links,
@@ -124,49 +406,29 @@ class PlaywrightCoverageAnalyzer:
         Returns:
             dict: Conteos de elementos extraidos
         """
-        text_corpus = crawler_result.get('text_corpus', {})
+        counts = {}
+
+        # Secciones con 'total_count' y, si es 0, la lista de respaldo
+        for key, list_key in self.PLAYWRIGHT_COUNT_SOURCES:
+            section = crawler_result.get(key, {})
+            count = section.get('total_count', 0)
+            if count == 0:
+                count = len(section.get(list_key, []))
+            counts[key] = count
 
-        # Links
-        links_data = crawler_result.get('links', {})
-        links = links_data.get('total_count', 0)
-        if links == 0:
-            links = len(links_data.get('all_links', []))
-
-        # Images
-        images_data = crawler_result.get('images', {})
-        images = images_data.get('total_count', 0)
-        if images == 0:
-            images = len(images_data.get('images', []))
-
-        # Headings
-        headings_data = crawler_result.get('headings', {})
-        headings = headings_data.get('total_count', 0)
-        if headings == 0:
-            headings = len(headings_data.get('headings', []))
-
-        # Forms
-        forms_data = crawler_result.get('forms', {})
-        forms = forms_data.get('total_count', 0)
-        if forms == 0:
-            forms = len(forms_data.get('forms', []))
+        text_corpus = crawler_result.get('text_corpus', {})
 
         # Text words
-        text_words = text_corpus.get('total_words', 0)
+        counts['text_words'] = text_corpus.get('total_words', 0)
 
         # Buttons
         buttons = text_corpus.get('total_buttons', 0)
         if buttons == 0:
             button_texts = text_corpus.get('button_texts', [])
             buttons = len(button_texts) if isinstance(button_texts, list) else 0
+        counts['buttons'] = buttons
 
-        return {
-            'links': links,
-            'images': images,
-            'headings': headings,
-            'forms': forms,
-            'text_words': text_words,
-            'buttons': buttons
-        }
+        return counts
 
     def measure_playwright_benefit(self, url: str, crawler) -> Dict[str, Any]:
         """
@@ -179,12 +441,32 @@ class PlaywrightCoverageAnalyzer:
         Returns:
             dict: Analisis completo con cobertura y beneficio
         """
-        print(f"  [1/3] Extrayendo HTML estatico...")
+        logger.info("[1/3] Extrayendo HTML estatico de %s", url)
         without_js = self._extract_static(url)
 
-        print(f"  [2/3] Extrayendo con Playwright...")
+        logger.info("[2/3] Extrayendo con Playwright %s", url)
         crawler_result = crawler.crawl(url)
 
+        logger.info("[3/3] Calculando metricas de %s", url)
+        return self._compare_extractions(url, without_js, crawler_result)
+
+    def _compare_extractions(
+        self,
+        url: str,
+        without_js: Dict[str, int],
+        crawler_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Calcula cobertura y beneficio a partir de ambas extracciones.
+
+        Args:
+            url: URL analizada
+            without_js: Conteos del HTML estatico
+            crawler_result: Resultado del GobBoCrawler
+
+        Returns:
+            dict: Analisis completo con cobertura y beneficio
+        """
         if 'error' in crawler_result:
             return {
                 'url': url,
@@ -193,8 +475,6 @@ class PlaywrightCoverageAnalyzer:
 
         with_playwright = self._extract_with_playwright(crawler_result)
 
-        print(f"  [3/3] Calculando metricas...")
-
         # Calcular cobertura por categoria
         # La cobertura mide cuanto del contenido de Playwright estaba en HTML estatico
         coverage_by_category = {}
@@ -288,6 +568,27 @@ class PlaywrightCoverageAnalyzer:
         """
         Analiza multiples sitios y genera estadisticas agregadas.
 
+        Delega en analyze_multiple_sites_async; no debe llamarse desde un
+        event loop en ejecucion.
+
+        Args:
+            urls: Lista de URLs a analizar
+            crawler: Instancia de GobBoCrawler
+
+        Returns:
+            dict: Resultados y estadisticas agregadas
+        """
+        return asyncio.run(self.analyze_multiple_sites_async(urls, crawler))
+
+    async def analyze_multiple_sites_async(self, urls: List[str], crawler) -> Dict[str, Any]:
+        """
+        Analiza multiples sitios en paralelo y genera estadisticas agregadas.
+
+        Las descargas estaticas se hacen a la vez con httpx (hasta
+        STATIC_CONCURRENCY) mientras el crawler renderiza todos los sitios
+        con crawl_many() en un hilo aparte: un solo navegador, un contexto
+        por URL y varias paginas cargando a la vez.
+
         Args:
             urls: Lista de URLs a analizar
             crawler: Instancia de GobBoCrawler
@@ -298,18 +599,28 @@ class PlaywrightCoverageAnalyzer:
         results = []
         errors = []
 
-        for url in urls:
-            print(f"\n[SITIO] {url}")
-            result = self.measure_playwright_benefit(url, crawler)
+        loop = asyncio.get_running_loop()
+        static_task = asyncio.ensure_future(self._extract_static_many(urls))
+        # crawl_many usa asyncio.run, por eso corre fuera de este event loop
+        crawler_results = await loop.run_in_executor(None, crawler.crawl_many, urls)
+        static_counts = await static_task
+        self._save_static_cache()
+
+        for url, without_js, crawler_result in zip(urls, static_counts, crawler_results):
+            result = self._compare_extractions(url, without_js, crawler_result)
 
             if 'error' in result:
                 errors.append({'url': url, 'error': result['error']})
-                print(f"  [ERROR] {result['error']}")
+                logger.error("[SITIO] %s: %s", url, result['error'])
             else:
                 results.append(result)
-                print(f"  Arquitectura: {result['architecture_type']}")
-                print(f"  Cobertura estatica: {result['static_coverage_percent']}%")
-                print(f"  Mejora Playwright: +{result['playwright_improvement_percent']}%")
+                logger.info(
+                    "[SITIO] %s - Arquitectura: %s, cobertura estatica: %s%%, mejora Playwright: +%s%%",
+                    url,
+                    result['architecture_type'],
+                    result['static_coverage_percent'],
+                    result['playwright_improvement_percent']
+                )
 
         # Estadisticas agregadas
         mpas = [r for r in results if r['architecture_type'] == 'MPA']
@@ -368,15 +679,27 @@ class PlaywrightCoverageAnalyzer:
                 'max_static_coverage': None
             }
 
-        static_coverages = [r['static_coverage_percent'] for r in results]
-        pw_improvements = [r['playwright_improvement_percent'] for r in results]
+        # Suma, minimo y maximo en una sola pasada
+        count = 0
+        static_sum = 0
+        improvement_sum = 0
+        static_min = static_max = results[0]['static_coverage_percent']
+        for r in results:
+            static_coverage = r['static_coverage_percent']
+            count += 1
+            static_sum += static_coverage
+            improvement_sum += r['playwright_improvement_percent']
+            if static_coverage < static_min:
+                static_min = static_coverage
+            elif static_coverage > static_max:
+                static_max = static_coverage
 
         return {
-            'count': len(results),
-            'avg_static_coverage': round(sum(static_coverages) / len(static_coverages), 2),
-            'avg_playwright_improvement': round(sum(pw_improvements) / len(pw_improvements), 2),
-            'min_static_coverage': round(min(static_coverages), 2),
-            'max_static_coverage': round(max(static_coverages), 2)
+            'count': count,
+            'avg_static_coverage': round(static_sum / count, 2),
+            'avg_playwright_improvement': round(improvement_sum / count, 2),
+            'min_static_coverage': round(static_min, 2),
+            'max_static_coverage': round(static_max, 2)
         }
 
     def print_report(self, report: Dict[str, Any]) -> None:
@@ -455,6 +778,7 @@ class PlaywrightCoverageAnalyzer:
 
     def save_report(self, report: Dict[str, Any], output_file: str = 'playwright_coverage_analysis.json') -> None:
         """Guarda reporte en archivo JSON"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # orjson escribe UTF-8 sin escapar (como ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"\n[OK] Resultados guardados en: {output_file}")
@@ -5,10 +5,14 @@ Este módulo implementa el crawler usando Scrapy para extraer contenido
 de sitios .gob.bo respetando políticas de crawling responsable.
 """
 
+import re
+import posixpath
 import scrapy
 from scrapy.http import Response
-from typing import Generator, Optional
+from functools import lru_cache
+from typing import Generator, List, Optional
 from urllib.parse import urljoin, urlparse
+from lxml import etree
 import logging
 
 from app.config import settings
@@ -16,6 +20,46 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+# Evitar crawlear recursos innecesarios
+_IGNORED_EXTENSIONS = frozenset({
+    'pdf', 'zip', 'rar', 'tar', 'gz', '7z',
+    'exe', 'dmg', 'pkg', 'deb', 'rpm',
+    'mp4', 'avi', 'mov', 'wmv', 'flv',
+    'mp3', 'wav', 'ogg', 'flac',
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'ico',
+    'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx'
+})
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """urlparse de una URL absoluta; los menús repiten los mismos enlaces en cada página."""
+    return urlparse(url)
+
+
+def _has_ignored_ext(url: str) -> bool:
+    """True si la ruta de la URL termina en una extensión de _IGNORED_EXTENSIONS."""
+    extension = posixpath.splitext(_cached_urlparse(url).path)[1]
+    return extension[1:].lower() in _IGNORED_EXTENSIONS
+
+
+# Equivale a response.css('body *::text'): textos cuyo padre es un descendiente de <body>
+_BODY_TEXT_XPATH = etree.XPath('//body//*/text()', smart_strings=False)
+
+# Encabezados que se reportan en 'headings'
+_HEADING_TAGS = ('h1', 'h2', 'h3')
+
+# Límite de caracteres de text_content
+_TEXT_CONTENT_LIMIT = 5000
+
+
+def _own_texts(element) -> List[str]:
+    """Nodos de texto hijos directos del elemento, como el selector '::text'."""
+    texts = [element.text] if element.text is not None else []
+    texts.extend(child.tail for child in element if child.tail is not None)
+    return texts
+
+
 class GobBoSpider(scrapy.Spider):
     """
     Spider para crawlear sitios web gubernamentales bolivianos.
@@ -30,10 +74,25 @@ class GobBoSpider(scrapy.Spider):
     name = "gob_bo_spider"
     allowed_domains = ["gob.bo"]
 
+    # Fragmentos de URL que no se siguen (una sola búsqueda por enlace)
+    IGNORE_PATTERNS = [
+        'javascript:', 'mailto:', 'tel:', '#',
+        'login', 'logout', 'admin', 'wp-admin',
+        'download', 'file', 'attachment'
+    ]
+    IGNORE_RE = re.compile('|'.join(map(re.escape, IGNORE_PATTERNS)), re.IGNORECASE)
+
     custom_settings = {
         'USER_AGENT': settings.crawler_user_agent,
+        # AutoThrottle ajusta el delay según la latencia observada;
+        # DOWNLOAD_DELAY queda como mínimo entre requests al mismo dominio
         'DOWNLOAD_DELAY': settings.crawler_delay,
-        'CONCURRENT_REQUESTS': 1,
+        'CONCURRENT_REQUESTS': settings.crawler_concurrent_requests,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': settings.crawler_concurrent_requests_per_domain,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': settings.crawler_delay,
+        'AUTOTHROTTLE_MAX_DELAY': 10.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 2.0,
         'DEPTH_LIMIT': settings.crawler_max_depth,
         'CLOSESPIDER_PAGECOUNT': settings.crawler_max_pages,
         'ROBOTSTXT_OBEY': True,
@@ -43,14 +102,7 @@ class GobBoSpider(scrapy.Spider):
         'REDIRECT_MAX_TIMES': 3,
 
         # Evitar crawlear recursos innecesarios
-        'IGNORED_EXTENSIONS': [
-            'pdf', 'zip', 'rar', 'tar', 'gz', '7z',
-            'exe', 'dmg', 'pkg', 'deb', 'rpm',
-            'mp4', 'avi', 'mov', 'wmv', 'flv',
-            'mp3', 'wav', 'ogg', 'flac',
-            'jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'ico',
-            'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx'
-        ]
+        'IGNORED_EXTENSIONS': sorted(_IGNORED_EXTENSIONS)
     }
 
     def __init__(
@@ -77,6 +129,7 @@ class GobBoSpider(scrapy.Spider):
         # Extraer dominio de la URL inicial
         parsed = urlparse(start_url)
         self.allowed_domains = [parsed.netloc]
+        self._allowed_netlocs = frozenset(self.allowed_domains)
 
         # Personalizar límites si se proporcionan
         if max_pages:
@@ -107,87 +160,105 @@ class GobBoSpider(scrapy.Spider):
 
         try:
             # Extraer información de la página
-            page_data = {
-                'url': response.url,
-                'status_code': response.status,
-                'title': self._extract_title(response),
-                'meta_description': self._extract_meta_description(response),
-                'headings': self._extract_headings(response),
-                'links': self._extract_links(response),
-                'images': self._extract_images(response),
-                'text_content': self._extract_text_content(response),
-                'has_forms': self._has_forms(response),
-                'language': self._extract_language(response),
-            }
+            page_data, hrefs = self._extract_page_data(response)
 
             yield page_data
 
             # Seguir enlaces internos
-            for link in self._get_internal_links(response):
+            for link in self._get_internal_links(response, hrefs):
                 yield response.follow(link, callback=self.parse)
 
         except Exception as e:
             self.errors_count += 1
             logger.error(f"Error parseando {response.url}: {e}")
 
-    def _extract_title(self, response: Response) -> str:
-        """Extrae el título de la página."""
-        title = response.css('title::text').get()
-        return title.strip() if title else ""
-
-    def _extract_meta_description(self, response: Response) -> str:
-        """Extrae la meta descripción."""
-        desc = response.css('meta[name="description"]::attr(content)').get()
-        return desc.strip() if desc else ""
-
-    def _extract_headings(self, response: Response) -> dict:
-        """Extrae todos los encabezados (h1-h6)."""
-        return {
-            'h1': response.css('h1::text').getall(),
-            'h2': response.css('h2::text').getall(),
-            'h3': response.css('h3::text').getall(),
-        }
+    def _extract_page_data(self, response: Response) -> tuple:
+        """
+        Extrae los datos de la página en un solo recorrido del árbol lxml.
 
-    def _extract_links(self, response: Response) -> list:
-        """Extrae todos los enlaces de la página."""
-        links = response.css('a::attr(href)').getall()
-        return [urljoin(response.url, link) for link in links]
+        Usa el árbol ya parseado por Scrapy (response.selector.root) en lugar
+        de una consulta CSS por campo. Los resultados son los mismos que los
+        selectores 'title::text', 'h1::text', 'a::attr(href)', etc.
+
+        Args:
+            response: Respuesta HTTP de Scrapy
 
-    def _extract_images(self, response: Response) -> list:
-        """Extrae información de imágenes."""
+        Returns:
+            tuple: (datos de la página, valores href de los enlaces en orden)
+        """
+        root = response.selector.root
+
+        title = None
+        meta_description = None
+        language = None
+        headings = {tag: [] for tag in _HEADING_TAGS}
+        hrefs = []
         images = []
-        for img in response.css('img'):
-            images.append({
-                'src': img.css('::attr(src)').get(),
-                'alt': img.css('::attr(alt)').get() or "",
-            })
-        return images
-
-    def _extract_text_content(self, response: Response) -> str:
-        """Extrae el texto principal de la página."""
-        # Extraer texto del body, excluyendo scripts y estilos
-        text = response.css('body *::text').getall()
-        return ' '.join([t.strip() for t in text if t.strip()])[:5000]  # Limitar a 5000 caracteres
-
-    def _has_forms(self, response: Response) -> bool:
-        """Verifica si la página tiene formularios."""
-        return len(response.css('form')) > 0
-
-    def _extract_language(self, response: Response) -> str:
-        """Extrae el idioma de la página."""
-        lang = response.css('html::attr(lang)').get()
-        return lang if lang else "unknown"
-
-    def _get_internal_links(self, response: Response) -> list:
+        has_forms = False
+
+        for element in root.iter(etree.Element):
+            tag = element.tag
+            if tag == 'a':
+                href = element.get('href')
+                if href is not None:
+                    hrefs.append(href)
+            elif tag == 'img':
+                images.append({
+                    'src': element.get('src'),
+                    'alt': element.get('alt') or "",
+                })
+            elif tag in headings:
+                headings[tag].extend(_own_texts(element))
+            elif tag == 'title':
+                if title is None:
+                    texts = _own_texts(element)
+                    if texts:
+                        title = texts[0]
+            elif tag == 'meta':
+                if (meta_description is None and element.get('name') == 'description'
+                        and element.get('content') is not None):
+                    meta_description = element.get('content')
+            elif tag == 'form':
+                has_forms = True
+            elif tag == 'html':
+                if language is None:
+                    language = element.get('lang')
+
+        # Texto del body: se deja de acumular al superar el límite
+        text_parts = []
+        text_length = 0
+        for text in _BODY_TEXT_XPATH(root):
+            text = text.strip()
+            if text:
+                text_parts.append(text)
+                text_length += len(text) + 1
+                if text_length > _TEXT_CONTENT_LIMIT:
+                    break
+
+        page_data = {
+            'url': response.url,
+            'status_code': response.status,
+            'title': title.strip() if title else "",
+            'meta_description': meta_description.strip() if meta_description else "",
+            'headings': headings,
+            'links': [urljoin(response.url, href) for href in hrefs],
+            'images': images,
+            'text_content': ' '.join(text_parts)[:_TEXT_CONTENT_LIMIT],
+            'has_forms': has_forms,
+            'language': language if language else "unknown",
+        }
+        return page_data, hrefs
+
+    def _get_internal_links(self, response: Response, hrefs: List[str]) -> list:
         """Obtiene enlaces internos válidos para seguir crawleando."""
         links = []
-        for link in response.css('a::attr(href)').getall():
+        for link in hrefs:
             absolute_url = urljoin(response.url, link)
-            parsed = urlparse(absolute_url)
 
             # Verificar que sea un enlace interno válido
-            if (parsed.netloc in self.allowed_domains and
-                not self._should_ignore_url(absolute_url)):
+            if (_cached_urlparse(absolute_url).netloc in self._allowed_netlocs and
+                not self._should_ignore_url(absolute_url) and
+                not _has_ignored_ext(absolute_url)):
                 links.append(link)
 
         return links
@@ -202,14 +273,7 @@ class GobBoSpider(scrapy.Spider):
         Returns:
             bool: True si debe ignorarse
         """
-        ignore_patterns = [
-            'javascript:', 'mailto:', 'tel:', '#',
-            'login', 'logout', 'admin', 'wp-admin',
-            'download', 'file', 'attachment'
-        ]
-
-        url_lower = url.lower()
-        return any(pattern in url_lower for pattern in ignore_patterns)
+        return self.IGNORE_RE.search(url) is not None
 
     def closed(self, reason):
         """
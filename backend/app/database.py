@@ -9,33 +9,64 @@ from typing import Generator
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import Pool
 
 from app.config import settings
 
+
+def _connect_args() -> dict:
+    """
+    Parámetros que se fijan al abrir cada conexión.
+
+    En PostgreSQL la configuración de sesión viaja en el propio connect
+    (opción libpq), sin una consulta adicional por conexión.
+    """
+    if not settings.database_url.startswith("postgresql"):
+        return {}
+    return {
+        "options": (
+            f"-c statement_timeout={settings.db_statement_timeout_ms}"
+            " -c jit=off"
+            " -c synchronous_commit=local"
+        )
+    }
+
+
 # Crear engine de SQLAlchemy con configuración de pool
 engine = create_engine(
     settings.database_url,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,  # Verifica conexiones antes de usarlas
+    # El ping previo a cada checkout solo en desarrollo; en producción las
+    # conexiones se reciclan antes de que el servidor las cierre por inactividad
+    pool_pre_ping=settings.environment == "development",
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,  # Reutiliza primero las conexiones más recientes
+    connect_args=_connect_args(),
     echo=settings.debug,  # Log de queries SQL en modo debug
 )
 
 
-# Event listener para habilitar foreign keys en SQLite (si se usa)
-@event.listens_for(Pool, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
-    """
-    Habilita foreign keys en SQLite.
+_IS_SQLITE = engine.dialect.name == "sqlite"
 
-    Args:
-        dbapi_conn: Conexión de la base de datos
-        connection_record: Registro de la conexión
-    """
-    if "sqlite" in settings.database_url:
+
+# Event listener para habilitar foreign keys en SQLite (si se usa). Se registra
+# solo en este engine y solo con SQLite, no en cada pool del proceso
+if _IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        """
+        Habilita foreign keys y ajusta el journal y la cache de SQLite.
+
+        Args:
+            dbapi_conn: Conexión de la base de datos
+            connection_record: Registro de la conexión
+        """
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
         cursor.close()
 
 
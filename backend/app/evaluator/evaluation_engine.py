@@ -29,6 +29,13 @@ except ImportError:
     Session = None
     NLPAnalysis = None
 
+# Invalidacion de las metricas cacheadas del dashboard (requiere Redis)
+try:
+    from app.cache import invalidate_stats_cache
+except ImportError:
+    def invalidate_stats_cache() -> int:
+        return 0
+
 # Importar evaluadores REALES
 from .accesibilidad_evaluator import EvaluadorAccesibilidad
 from .usabilidad_evaluator import EvaluadorUsabilidad
@@ -578,6 +585,7 @@ class EvaluationEngine:
         self.db.add(evaluation)
         self.db.commit()
         self.db.refresh(evaluation)
+        invalidate_stats_cache()
 
         try:
             all_results = []
@@ -650,6 +658,7 @@ class EvaluationEngine:
             evaluation.completed_at = datetime.now(_TZ_BOT).replace(tzinfo=None)
 
             self.db.commit()
+            invalidate_stats_cache()
 
             return {
                 "evaluation_id": evaluation.id,
@@ -680,6 +689,7 @@ class EvaluationEngine:
             evaluation.status = 'failed'
             evaluation.error_message = str(e)
             self.db.commit()
+            invalidate_stats_cache()
             raise
 
     def _run_nlp_analysis(self, extracted_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1138,4 +1148,9 @@ def evaluar_url(url: str, progress_callback=None) -> Dict[str, Any]:
         Dict con resultados completos
     """
     engine = EvaluationEngine()
-    return engine.evaluate_url(url, progress_callback=progress_callback)
+    try:
+        return engine.evaluate_url(url, progress_callback=progress_callback)
+    finally:
+        # Liberar el navegador Playwright persistente del crawler
+        if engine.crawler is not None:
+            engine.crawler.close()
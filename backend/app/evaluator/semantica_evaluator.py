@@ -513,8 +513,9 @@ class EvaluadorSemantica(BaseEvaluator):
         for tag_name in tags_prohibidos_attrs:
             elements = soup.find_all(tag_name)
             for elem in elements:
+                elem_attrs = elem.attrs
                 for attr in atributos_obsoletos:
-                    if elem.has_attr(attr):
+                    if attr in elem_attrs:
                         problemas.append({
                             'tipo': 'atributo_obsoleto',
                             'elemento': f'<{tag_name} {attr}="{elem[attr]}">',
@@ -16,7 +16,7 @@ def _now_bot():
 from typing import List, Optional
 from sqlalchemy import (
     String, Float, Boolean, DateTime,
-    ForeignKey, Text, JSON, Enum as SQLEnum, ARRAY
+    ForeignKey, Text, JSON, Enum as SQLEnum, ARRAY, Index, text
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
@@ -220,6 +220,11 @@ class Evaluation(Base):
     """
 
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # Filtros por rango de fechas de /stats/* y de los dashboards
+        Index("idx_evaluations_started_at", "started_at"),
+        Index("idx_evaluations_evaluator_started", "evaluator_id", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     website_id: Mapped[int] = mapped_column(ForeignKey("websites.id", ondelete="CASCADE"), nullable=False)
@@ -326,6 +331,14 @@ class Followup(Base):
     """
 
     __tablename__ = "followups"
+    __table_args__ = (
+        # Índice parcial: solo los seguimientos pendientes (conteo del dashboard)
+        Index(
+            "idx_followups_pending",
+            "status",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     evaluation_id: Mapped[int] = mapped_column(
@@ -82,6 +82,7 @@ class HTMLStructure(TypedDict, total=False):
     doctype: Optional[str]
     obsolete_elements: List[Dict[str, Any]]
     obsolete_attributes: List[Dict[str, Any]]
+    obsolete_attributes_capped: bool
     table_count: int
     document_hierarchy: DocumentHierarchy
 
@@ -0,0 +1,43 @@
+"""
+Migración: Agregar índices usados por los filtros de estadísticas.
+Ejecutar: python migrations/005_add_stats_indexes.py
+"""
+from app.database import engine
+from sqlalchemy import text
+
+
+def run_migration():
+    print("Ejecutando migración: índices de estadísticas...")
+
+    with engine.connect() as conn:
+        try:
+            # 1. Índices de evaluations por fecha de inicio
+            print("  - Creando índices en evaluations...")
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_evaluations_started_at ON evaluations(started_at)
+            """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_evaluations_evaluator_started
+                ON evaluations(evaluator_id, started_at)
+            """))
+            conn.commit()
+            print("    OK Índices de evaluations creados")
+
+            # 2. Índice parcial de seguimientos pendientes
+            print("  - Creando índice parcial en followups...")
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_followups_pending ON followups(status) WHERE status = 'pending'
+            """))
+            conn.commit()
+            print("    OK Índice de followups creado")
+
+            print("\nMigración completada exitosamente!")
+
+        except Exception as e:
+            print(f"Error: {e}")
+            conn.rollback()
+            raise
+
+
+if __name__ == "__main__":
+    run_migration()
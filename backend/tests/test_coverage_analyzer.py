@@ -0,0 +1,64 @@
+"""
+Tests unitarios del analizador de cobertura (sin crawlear sitios reales).
+"""
+
+import json
+
+import pytest
+
+from app.crawler.coverage_analyzer import CoverageAnalyzer
+
+
+URL = 'https://www.ejemplo.gob.bo'
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    gt_file = tmp_path / 'ground_truth.json'
+    gt_file.write_text(json.dumps({'sites': [{
+        'url': URL,
+        'architecture': 'MPA',
+        'manual_inspection': {'links': 10, 'images': 4, 'text_words': 100},
+    }]}), encoding='utf-8')
+    return CoverageAnalyzer(str(gt_file))
+
+
+def crawler_result():
+    return {
+        'url': URL,
+        'links': {'total_count': 8},
+        'images': {'images': [{}, {}]},
+        'text_corpus': {'total_words': 100},
+    }
+
+
+class TestMeasureCoverageCache:
+    """Los resultados memoizados no deben compartir objetos mutables"""
+
+    def test_mutar_un_resultado_no_afecta_al_siguiente(self, analyzer):
+        first = analyzer.measure_coverage(crawler_result())
+        expected = json.loads(json.dumps(first))
+
+        first['total_coverage_percent'] = -1
+        first['coverage_by_category']['links'] = -1
+        first['extracted']['links'] = -1
+        first['ground_truth']['links'] = -1
+        first['comparison']['links']['missing'] = -1
+        first['googlebot_comparison']['benchmark'] = -1
+
+        second = analyzer.measure_coverage(crawler_result())
+        assert second == expected
+        assert analyzer.ground_truth[URL]['manual_inspection']['links'] == 10
+
+    def test_resultados_repetidos_son_objetos_distintos(self, analyzer):
+        first = analyzer.measure_coverage(crawler_result())
+        second = analyzer.measure_coverage(crawler_result())
+
+        assert first == second
+        assert first['coverage_by_category'] is not second['coverage_by_category']
+        assert first['extracted'] is not second['extracted']
+        assert first['ground_truth'] is not second['ground_truth']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+"""
+Tests del cierre de navegadores Playwright persistentes usados desde varios hilos.
+
+Playwright no se lanza: se sustituye por un doble que, igual que la API
+sync real, falla si se cierra desde un hilo distinto al que lo inició.
+"""
+
+import threading
+
+import pytest
+
+from app.crawler import html_crawler
+from app.crawler.coverage_analyzer import CoverageAnalyzer
+from app.crawler.html_crawler import GobBoCrawler
+
+
+class FakeBrowser:
+    def __init__(self, owner):
+        self.owner = owner
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        if threading.current_thread() is not self.owner:
+            raise RuntimeError("cannot switch to a different thread")
+        self.closed = True
+
+
+class FakePlaywright:
+    instances = []
+
+    def __init__(self):
+        self.owner = threading.current_thread()
+        self.stopped = False
+        self.browsers = []
+        self.chromium = self
+        FakePlaywright.instances.append(self)
+
+    def start(self):
+        return self
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser(self.owner)
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        if threading.current_thread() is not self.owner:
+            raise RuntimeError("cannot switch to a different thread")
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    FakePlaywright.instances = []
+    monkeypatch.setattr(html_crawler, 'sync_playwright', FakePlaywright)
+    return FakePlaywright.instances
+
+
+def _all_closed(instances):
+    return all(p.stopped and all(b.closed for b in p.browsers) for p in instances)
+
+
+class TestBrowserThreads:
+    """Cada navegador debe cerrarse en el hilo que lo lanzó"""
+
+    def test_close_thread_browser_en_cada_hilo(self, fake_playwright):
+        crawler = GobBoCrawler()
+
+        def use_and_release():
+            crawler._get_browser()
+            crawler.close_thread_browser()
+
+        threads = [threading.Thread(target=use_and_release) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(fake_playwright) == 3
+        assert _all_closed(fake_playwright)
+        assert crawler._browsers == []
+        crawler.close()
+
+    def test_close_no_toca_navegadores_de_otros_hilos(self, fake_playwright, caplog):
+        crawler = GobBoCrawler()
+        worker = threading.Thread(target=crawler._get_browser)
+        worker.start()
+        worker.join()
+
+        crawler._get_browser()
+        crawler.close()
+
+        own, other = (
+            (fake_playwright[1], fake_playwright[0])
+            if fake_playwright[1].owner is threading.current_thread()
+            else (fake_playwright[0], fake_playwright[1])
+        )
+        assert own.stopped
+        assert not other.stopped
+        assert "cannot switch" not in caplog.text
+        assert "otros hilos" in caplog.text
+
+    def test_generate_report_cierra_navegadores_de_los_workers(self, fake_playwright, tmp_path):
+        gt_file = tmp_path / 'ground_truth.json'
+        gt_file.write_text(
+            '{"sites": [' + ','.join(
+                '{"url": "https://s%d.gob.bo", "manual_inspection": {"links": 1}}' % i
+                for i in range(6)
+            ) + ']}',
+            encoding='utf-8'
+        )
+
+        crawler = GobBoCrawler()
+
+        def fake_crawl(url):
+            crawler._get_browser()
+            return {'url': url, 'links': {'total_count': 1}}
+
+        crawler.crawl = fake_crawl
+        analyzer = CoverageAnalyzer(str(gt_file))
+
+        report = analyzer.generate_report(crawler, max_workers=3)
+
+        assert report['summary']['successful'] == 6
+        assert 1 <= len(fake_playwright) <= 3
+        assert _all_closed(fake_playwright)
+        assert crawler._browsers == []
+
+    def test_crawl_many_cierra_el_navegador_del_fallback_sync(self, fake_playwright, monkeypatch):
+        crawler = GobBoCrawler()
+
+        async def failing_render(urls, concurrency):
+            raise RuntimeError("sin navegador async")
+
+        def fake_fetch(url):
+            crawler._get_browser()
+            return None
+
+        monkeypatch.setattr(crawler, '_prepare_url', lambda url: (url, None))
+        monkeypatch.setattr(crawler, '_render_many', failing_render)
+        monkeypatch.setattr(crawler, '_fetch_page_with_playwright', fake_fetch)
+        monkeypatch.setattr(crawler, '_complete_fetch', lambda url, html: {'error': 'sin HTML', 'url': url})
+
+        # Igual que analyze_multiple_sites_async: crawl_many corre en otro hilo
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(crawler.crawl_many(['https://a.gob.bo', 'https://b.gob.bo']))
+        )
+        worker.start()
+        worker.join()
+
+        assert [r['error'] for r in results] == ['sin HTML', 'sin HTML']
+        assert len(fake_playwright) == 1
+        assert _all_closed(fake_playwright)
+        assert crawler._browsers == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
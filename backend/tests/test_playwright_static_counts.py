@@ -0,0 +1,75 @@
+"""
+Tests del conteo de HTML estatico de PlaywrightCoverageAnalyzer.
+
+Las descargas se sirven con httpx.MockTransport, sin acceder a la red.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.crawler.playwright_coverage_analyzer import PlaywrightCoverageAnalyzer
+
+
+EMPTY_COUNTS = {
+    'links': 0, 'images': 0, 'headings': 0, 'forms': 0, 'text_words': 0, 'buttons': 0
+}
+
+PAGES = {
+    '/solo-xml': '<?xml version="1.0" encoding="utf-8"?>',
+    '/xml-comentario': '<?xml version="1.0" encoding="utf-8"?>\n<!-- sin contenido -->',
+    '/normal': '<html><body><h1>Titulo</h1><a href="/a">Enlace uno</a></body></html>',
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={'Content-Type': 'text/html; charset=utf-8'},
+        text=PAGES[request.url.path],
+    )
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    options = PlaywrightCoverageAnalyzer._client_options
+
+    def mock_options(self):
+        return {**options(self), 'http2': False, 'transport': httpx.MockTransport(handler)}
+
+    monkeypatch.setattr(PlaywrightCoverageAnalyzer, '_client_options', mock_options)
+    analyzer = PlaywrightCoverageAnalyzer(timeout=5)
+    yield analyzer
+    analyzer.close()
+
+
+class TestStaticCountsDocumentoVacio:
+    """Un HTML con solo la declaracion XML (y comentarios) cuenta cero"""
+
+    @pytest.mark.parametrize('html', [PAGES['/solo-xml'], PAGES['/xml-comentario'], ''])
+    def test_count_static_elements_documento_vacio(self, analyzer, html):
+        assert analyzer._count_static_elements(html) == EMPTY_COUNTS
+
+    def test_extract_static_sync(self, analyzer):
+        assert analyzer._extract_static('https://sitio.gob.bo/solo-xml') == EMPTY_COUNTS
+        normal = analyzer._extract_static('https://sitio.gob.bo/normal')
+        assert normal['links'] == 1
+        assert normal['headings'] == 1
+
+    def test_extract_static_many_no_aborta_el_lote(self, analyzer):
+        urls = [
+            'https://sitio.gob.bo/solo-xml',
+            'https://sitio.gob.bo/xml-comentario',
+            'https://sitio.gob.bo/normal',
+        ]
+
+        results = asyncio.run(analyzer._extract_static_many(urls))
+
+        assert results[0] == EMPTY_COUNTS
+        assert results[1] == EMPTY_COUNTS
+        assert results[2]['links'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,231 @@
+"""
+Tests del cache de las rutas /stats y de los claims JWT.
+
+Cubre ETag/304, la respuesta obsoleta (Warning 110) cuando la BD falla y
+el cache de claims decodificados. No requiere Redis ni PostgreSQL: el
+cache y la sesión se sustituyen por dobles en memoria.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from app.api import stats_routes
+from app.auth import dependencies
+from app.auth.dependencies import allow_admin_secretary, get_current_user
+from app.auth.security import create_access_token
+from app.database import get_db
+
+
+class FakeCache:
+    """Cache en memoria con la misma interfaz stale que CacheManager"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def set_with_stale(self, key, value, fresh_ttl, stale_ttl=86400):
+        self.entries[key] = {"data": value, "fresh_until": time.time() + fresh_ttl}
+        return True
+
+    def get_with_stale(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, False
+        return entry["data"], time.time() >= entry["fresh_until"]
+
+    def expire(self, key):
+        self.entries[key]["fresh_until"] = 0
+
+
+class FakeQuery:
+    def __init__(self, session):
+        self.session = session
+
+    def filter(self, *args):
+        return self
+
+    def count(self):
+        self.session.check()
+        return 3
+
+    def scalar(self):
+        self.session.check()
+        return 80.0
+
+
+class FakeSession:
+    def __init__(self):
+        self.fail = False
+
+    def check(self):
+        if self.fail:
+            raise OperationalError("SELECT 1", {}, Exception("BD caída"))
+
+    def query(self, *args):
+        return FakeQuery(self)
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(stats_routes, "cache_manager", fake)
+    return fake
+
+
+@pytest.fixture
+def client(session, cache):
+    app = FastAPI()
+    app.include_router(stats_routes.router)
+    app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[allow_admin_secretary] = lambda: object()
+    return TestClient(app)
+
+
+class TestStatsETag:
+    """ETag y 304 Not Modified en /stats/overview"""
+
+    def test_respuesta_incluye_etag_y_cache_control(self, client):
+        response = client.get("/stats/overview")
+
+        assert response.status_code == 200
+        assert response.json()["total_websites"] == 3
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"] == stats_routes.BROWSER_CACHE_CONTROL
+
+    def test_if_none_match_igual_retorna_304(self, client):
+        etag = client.get("/stats/overview").headers["ETag"]
+
+        response = client.get("/stats/overview", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_if_none_match_distinto_retorna_200(self, client):
+        response = client.get("/stats/overview", headers={"If-None-Match": '"otro"'})
+
+        assert response.status_code == 200
+        assert "total_websites" in response.json()
+
+
+class TestStatsStaleFallback:
+    """Si la BD falla se sirve el último valor cacheado con Warning 110"""
+
+    def test_bd_caida_sirve_cache_obsoleto(self, client, session, cache):
+        fresh = client.get("/stats/overview")
+        cache.expire("stats:overview")
+        session.fail = True
+
+        response = client.get("/stats/overview")
+
+        assert response.status_code == 200
+        assert response.json() == fresh.json()
+        assert response.headers["Warning"] == stats_routes.STALE_WARNING
+
+    def test_304_obsoleto_conserva_warning(self, client, session, cache):
+        etag = client.get("/stats/overview").headers["ETag"]
+        cache.expire("stats:overview")
+        session.fail = True
+
+        response = client.get("/stats/overview", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["Warning"] == stats_routes.STALE_WARNING
+
+    def test_bd_caida_sin_cache_propaga_error(self, client, session):
+        session.fail = True
+
+        with pytest.raises(OperationalError):
+            client.get("/stats/overview")
+
+    def test_cache_fresco_no_consulta_la_bd(self, client, session):
+        client.get("/stats/overview")
+        session.fail = True
+
+        response = client.get("/stats/overview")
+
+        assert response.status_code == 200
+        assert "Warning" not in response.headers
+
+
+class FakeUserQuery:
+    def __init__(self, user):
+        self.user = user
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self.user
+
+
+class FakeUserSession:
+    def __init__(self, user):
+        self.user = user
+
+    def query(self, *args):
+        return FakeUserQuery(self.user)
+
+
+class TestJWTClaimsCache:
+    """Los claims se decodifican una vez por token y exp se revisa siempre"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        dependencies._decode_token_claims.cache_clear()
+        yield
+        dependencies._decode_token_claims.cache_clear()
+
+    def test_token_repetido_se_decodifica_una_vez(self, monkeypatch):
+        token = create_access_token({"sub": "admin"})
+        calls = []
+        real_decode = dependencies.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args[0])
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(dependencies.jwt, "decode", counting_decode)
+        user = object()
+        db = FakeUserSession(user)
+
+        for _ in range(3):
+            assert asyncio.run(get_current_user(token, db)) is user
+        assert calls == [token]
+
+    def test_token_expirado_en_cache_se_rechaza(self, monkeypatch):
+        token = create_access_token({"sub": "admin"}, timedelta(seconds=60))
+        db = FakeUserSession(object())
+        asyncio.run(get_current_user(token, db))
+
+        future = time.time() + 120
+        monkeypatch.setattr(dependencies.time, "time", lambda: future)
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_current_user(token, db))
+        assert exc.value.status_code == 401
+
+    def test_token_invalido_no_se_cachea(self):
+        db = FakeUserSession(object())
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_current_user("no-es-un-jwt", db))
+        assert exc.value.status_code == 401
+        assert dependencies._decode_token_claims.cache_info().currsize == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])